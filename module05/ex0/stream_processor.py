@@ -1,5 +1,17 @@
+import asyncio
+import mmap
+import os
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Optional, List, Dict
+from array import array
+from collections import Counter, deque
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from functools import reduce
+from itertools import islice
+from multiprocessing import Pool
+from typing import (Any, Optional, List, Dict, Union, Iterable, Iterator,
+                    Tuple, Type)
 
 
 class DataProcessor(ABC):
@@ -51,6 +63,335 @@ class DataProcessor(ABC):
         return f"{result}"
 
 
+class QuantileSketch:
+    """Bounded, mergeable sketch used to estimate quantiles of a stream.
+
+    Values are kept in levels, a value of level h standing for 2 ** h
+    values of the stream. Values are fed at most capacity at a time and
+    whenever a level grows past the capacity it is sorted and every
+    other value is promoted to the next level, so each sort covers at
+    most twice the capacity and memory stays O(capacity * log(n)).
+
+    Attributes:
+        capacity: Number of values a level holds before a compaction.
+        levels: Retained values of each level.
+        offset: Which value of each pair survives the next compaction.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        """Initialize an empty QuantileSketch.
+
+        Args:
+            capacity: Number of values a level holds before a compaction.
+        """
+
+        if capacity < 1:
+            raise ValueError("QuantileSketch capacity must be positive")
+        self.capacity: int = capacity
+        self.levels: List[List[float]] = [[]]
+        self.offset: int = 0
+
+    def update(self, data: Iterable[Union[int, float]]) -> None:
+        """Add every value of data to the first level
+
+        Args:
+            data (Iterable[Union[int, float]]): the values to add
+        """
+
+        values: Iterator[Union[int, float]] = iter(data)
+        while True:
+            level: List[float] = self.levels[0]
+            before: int = len(level)
+            level.extend(islice(values, self.capacity))
+            if len(level) == before:
+                break
+            if len(level) > self.capacity:
+                self.compact()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold the content of another sketch into this one
+
+        Args:
+            other (QuantileSketch): the sketch to merge
+        """
+
+        for height, values in enumerate(other.levels):
+            while len(self.levels) <= height:
+                self.levels.append([])
+            for start in range(0, len(values), self.capacity):
+                self.levels[height].extend(
+                    values[start:start + self.capacity])
+                if len(self.levels[height]) > self.capacity:
+                    self.compact()
+
+    def compact(self) -> None:
+        """Promote half of every level that outgrew the capacity"""
+
+        height: int = 0
+        while height < len(self.levels):
+            level: List[float] = self.levels[height]
+            if len(level) > self.capacity:
+                level.sort()
+                kept: List[float] = level[-1:] if len(level) % 2 else []
+                paired: List[float] = level[:len(level) - len(kept)]
+                if height + 1 == len(self.levels):
+                    self.levels.append([])
+                self.levels[height + 1].extend(paired[self.offset::2])
+                self.levels[height] = kept
+                self.offset ^= 1
+            height += 1
+
+    def weighted(self) -> List[tuple]:
+        """Sorted (value, weight) pairs of every retained value
+
+        Returns:
+            List[tuple]: the retained values with their weight
+        """
+
+        return sorted((value, 1 << height)
+                      for height, level in enumerate(self.levels)
+                      for value in level)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile of the values seen so far
+
+        Args:
+            q (float): the quantile to estimate, between 0 and 1
+
+        Raises:
+            ValueError: if q is not between 0 and 1
+
+        Returns:
+            Optional[float]: the estimate or None if the sketch is empty
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        pairs: List[tuple] = self.weighted()
+        if not pairs:
+            return None
+        target: float = q * sum(weight for _, weight in pairs)
+        seen: int = 0
+        for value, weight in pairs:
+            seen += weight
+            if seen >= target:
+                return value
+        return pairs[-1][0]
+
+
+def merge_moments(count: int, mean: float, m2: float, n: int,
+                  group_mean: float, group_m2: float) -> Tuple[float, float]:
+    """Merge the moments of two groups with Chan's parallel formula
+
+    Args:
+        count (int): number of values of the first group
+        mean (float): mean of the first group
+        m2 (float): sum of squared distances to the first group mean
+        n (int): number of values of the second group
+        group_mean (float): mean of the second group
+        group_m2 (float): sum of squared distances to the second group mean
+
+    Returns:
+        Tuple[float, float]: the mean and m2 of both groups together
+    """
+
+    total: int = count + n
+    delta: float = group_mean - mean
+    return (mean + delta * n / total,
+            m2 + group_m2 + delta * delta * count * n / total)
+
+
+class PartialAggregate:
+    """Serializable statistics of a stream of numbers.
+
+    Mean and variance follow Welford's algorithm, each batch and each
+    other aggregate being merged with Chan's parallel formula, so an
+    update costs O(batch) and stays exact where sum(x * x) - total * mean
+    would cancel out. Partial aggregates merge associatively, so results
+    of workers can be reduced in any grouping in O(workers).
+
+    Attributes:
+        count: Number of values aggregated.
+        total: Sum of the values.
+        mean: Mean of the values.
+        m2: Sum of squared distances to the mean.
+        minimum: Smallest value.
+        maximum: Largest value.
+        sketch: Quantile sketch of the values.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        """Initialize an empty PartialAggregate.
+
+        Args:
+            capacity: Capacity of the quantile sketch.
+        """
+
+        self.count: int = 0
+        self.total: Union[int, float] = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+        self.minimum: Optional[Union[int, float]] = None
+        self.maximum: Optional[Union[int, float]] = None
+        self.sketch: QuantileSketch = QuantileSketch(capacity)
+
+    def update(self, data: Any) -> None:
+        """Aggregate a batch of values
+
+        Args:
+            data (Any): a sequence or buffer of numbers
+        """
+
+        n: int = len(data)
+        if n == 0:
+            return
+        total: Union[int, float] = sum(data)
+        mean: float = total / n
+        m2: float = sum((x - mean) ** 2 for x in data)
+        self.combine(n, total, mean, m2, min(data), max(data))
+        self.sketch.update(data)
+
+    def merge(self, other: "PartialAggregate") -> "PartialAggregate":
+        """Merge another aggregate into this one
+
+        Args:
+            other (PartialAggregate): the aggregate to merge
+
+        Returns:
+            PartialAggregate: this aggregate, to be used with reduce
+        """
+
+        if other.count:
+            self.combine(other.count, other.total, other.mean, other.m2,
+                         other.minimum, other.maximum)
+            self.sketch.merge(other.sketch)
+        return self
+
+    def combine(self, n: int, total: Union[int, float], mean: float,
+                m2: float, low: Any, high: Any) -> None:
+        """Combine the moments of a group of n values with ours
+
+        Args:
+            n (int): number of values in the group
+            total (Union[int, float]): sum of the group
+            mean (float): mean of the group
+            m2 (float): sum of squared distances to the group mean
+            low (Any): smallest value of the group
+            high (Any): largest value of the group
+        """
+
+        self.mean, self.m2 = merge_moments(self.count, self.mean, self.m2,
+                                           n, mean, m2)
+        self.count += n
+        self.total += total
+        if self.minimum is None or low < self.minimum:
+            self.minimum = low
+        if self.maximum is None or high > self.maximum:
+            self.maximum = high
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the values aggregated"""
+
+        return self.m2 / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the aggregate to plain Python types
+
+        Returns:
+            Dict[str, Any]: the serialized aggregate
+        """
+
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "m2": self.m2,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "capacity": self.sketch.capacity,
+            "levels": [list(level) for level in self.sketch.levels],
+        }
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "PartialAggregate":
+        """Build an aggregate serialized with to_dict
+
+        Args:
+            data (Dict[str, Any]): the serialized aggregate
+
+        Raises:
+            ValueError: if a field is missing
+
+        Returns:
+            PartialAggregate: the rebuilt aggregate
+        """
+
+        try:
+            partial: PartialAggregate = PartialAggregate(data["capacity"])
+            partial.count = data["count"]
+            partial.total = data["total"]
+            partial.mean = data["mean"]
+            partial.m2 = data["m2"]
+            partial.minimum = data["minimum"]
+            partial.maximum = data["maximum"]
+            partial.sketch.levels = [list(level)
+                                     for level in data["levels"]]
+        except KeyError as e:
+            raise ValueError(f"Invalid partial aggregate: missing {e}")
+        return partial
+
+
+class RunningStats(PartialAggregate):
+    """Running statistics of a NumericProcessor, merged batch by batch.
+
+    The statistics are a PartialAggregate that partial exports as an
+    independent copy.
+    """
+
+    def partial(self) -> PartialAggregate:
+        """Export the statistics as a PartialAggregate
+
+        Returns:
+            PartialAggregate: a copy of the statistics
+        """
+
+        return PartialAggregate(self.sketch.capacity).merge(self)
+
+
+def aggregate_batch(data: Any) -> PartialAggregate:
+    """Aggregate one batch, meant to run in a worker process
+
+    Args:
+        data (Any): a sequence or buffer of numbers
+
+    Returns:
+        PartialAggregate: the aggregate of the batch
+    """
+
+    partial: PartialAggregate = PartialAggregate()
+    partial.update(data)
+    return partial
+
+
+def parallel_aggregate(batches: Iterable[Any],
+                       workers: Optional[int] = None) -> PartialAggregate:
+    """Aggregate batches on a pool of processes and reduce the results
+
+    Args:
+        batches (Iterable[Any]): the batches to aggregate
+        workers (Optional[int], optional): number of processes.
+            Defaults to the number of CPUs.
+
+    Returns:
+        PartialAggregate: the aggregate of every batch
+    """
+
+    with Pool(workers) as pool:
+        partials: List[PartialAggregate] = pool.map(aggregate_batch, batches)
+    return reduce(PartialAggregate.merge, partials, PartialAggregate())
+
+
 class NumericProcessor(DataProcessor):
     """Processor for numeric data.
 
@@ -58,23 +399,38 @@ class NumericProcessor(DataProcessor):
         count: Number of numeric values processed.
         total: Sum of all numeric values.
         avg: Average of all numeric values.
+        stats: Running statistics across calls in incremental mode.
+        NUMERIC_CODES: Buffer type codes accepted by the vectorized path.
     """
 
-    def __init__(self) -> None:
-        """Initialize NumericProcessor with accumulator attributes."""
+    NUMERIC_CODES: str = "bBhHiIlLqQfd"
+
+    def __init__(self, incremental: bool = False) -> None:
+        """Initialize NumericProcessor with accumulator attributes.
+
+        Args:
+            incremental: Accumulate statistics across calls instead of
+                replacing them on each call.
+        """
         super().__init__()
         self.count: Optional[int] = None
-        self.total: Optional[int] = None
+        self.total: Optional[Union[int, float]] = None
         self.avg: Optional[float] = None
+        self.stats: Optional[RunningStats] = None
+        if incremental:
+            self.stats = RunningStats()
 
     def process(self, data: Any) -> str:
         """Process data
 
+        Buffers (array.array, memoryview or NumPy arrays) are reduced in
+        a single native pass and are not echoed back element by element.
+
         Args:
             data (Any): the data to process
 
         Raises:
-            ValueError: if data is not a int or list of int
+            ValueError: if data is not a int, list of int or numeric buffer
 
         Returns:
             str: the data processed
@@ -82,25 +438,130 @@ class NumericProcessor(DataProcessor):
 
         if not self.validate(data):
             raise ValueError("Invalid data for NumericProcessor")
-        self.count = len(data)
-        self.total = sum(data)
+        if self.stats is not None:
+            return self.process_incremental(data)
+        if self.is_buffer(data):
+            return self.process_buffer(data)
+        values: List[int] = [data] if isinstance(data, int) else data
+        self.count = len(values)
+        self.total = sum(values)
         self.avg = self.total/self.count
         return f"Processing data: {data}"
 
+    def process_buffer(self, data: Any) -> str:
+        """Process a numeric buffer without converting it to a list
+
+        Args:
+            data (Any): an array.array, memoryview or NumPy array
+
+        Returns:
+            str: the data processed
+        """
+
+        if hasattr(data, "dtype"):
+            self.count = int(data.size)
+            self.total = data.sum().item()
+        else:
+            self.count = len(data)
+            self.total = sum(data)
+        self.avg = self.total/self.count if self.count else 0.0
+        return f"Processing data: {type(data).__name__}[{self.count}]"
+
+    def process_incremental(self, data: Any) -> str:
+        """Merge data into the running statistics
+
+        Args:
+            data (Any): the data to merge
+
+        Raises:
+            ValueError: if the processor is not incremental
+
+        Returns:
+            str: the data processed
+        """
+
+        if self.stats is None:
+            raise ValueError("NumericProcessor is not incremental")
+        if isinstance(data, int):
+            data = [data]
+        if hasattr(data, "dtype"):
+            data = data.ravel()
+        self.stats.update(data)
+        self.count = self.stats.count
+        self.total = self.stats.total
+        self.avg = self.stats.mean
+        if self.is_buffer(data):
+            return f"Processing data: {type(data).__name__}[{len(data)}]"
+        return f"Processing data: {data}"
+
+    def partial(self) -> PartialAggregate:
+        """Emit the running statistics as a mergeable aggregate
+
+        Raises:
+            ValueError: if the processor is not incremental
+
+        Returns:
+            PartialAggregate: the aggregate of every value processed
+        """
+
+        if self.stats is None:
+            raise ValueError("NumericProcessor is not incremental")
+        return self.stats.partial()
+
+    def merge(self, partial: PartialAggregate) -> None:
+        """Merge an aggregate emitted by another processor
+
+        Args:
+            partial (PartialAggregate): the aggregate to merge
+
+        Raises:
+            ValueError: if the processor is not incremental
+        """
+
+        if self.stats is None:
+            raise ValueError("NumericProcessor is not incremental")
+        self.stats.merge(partial)
+        self.count = self.stats.count
+        self.total = self.stats.total
+        self.avg = self.stats.mean
+
+    def is_buffer(self, data: Any) -> bool:
+        """Check if data is a buffer handled by the vectorized path
+
+        Args:
+            data (Any): data to check
+
+        Returns:
+            bool: true if array.array, memoryview or NumPy array
+        """
+
+        return isinstance(data, (array, memoryview)) or \
+            hasattr(data, "dtype")
+
     def validate(self, data: Any) -> bool:
-        """Check if data if a int or list of int
+        """Check if data if a int, list of int or numeric buffer
+
+        Buffers are validated by their type code or dtype, never by
+        looking at each element.
 
         Args:
             data (Any): data to validate
 
         Returns:
-            bool: true if int or list of int false either
+            bool: true if int, list of int or numeric buffer false either
         """
 
         if isinstance(data, int):
             return True
         if isinstance(data, list) and all(isinstance(x, int) for x in data):
             return True
+        if isinstance(data, array):
+            return data.typecode in self.NUMERIC_CODES
+        if isinstance(data, memoryview):
+            return data.ndim == 1 and \
+                data.format.lstrip("@=<>!") in self.NUMERIC_CODES
+        if hasattr(data, "dtype"):
+            return getattr(data.dtype, "kind", "") in ("i", "u", "f")
         return False
 
     def format_output(self, result: str) -> str:
@@ -113,9 +574,14 @@ class NumericProcessor(DataProcessor):
             str: the final output
         """
 
-        return result + \
+        output: str = result + \
             f"Processed {self.count} numeric values, " + \
             f"sum={self.total}, avg={self.avg}"
+        if self.stats is not None and self.stats.count:
+            output += f", var={self.stats.variance}, " + \
+                f"min={self.stats.minimum}, max={self.stats.maximum}, " + \
+                f"median~{self.stats.sketch.quantile(0.5)}"
+        return output
 
 
 class TextProcessor(DataProcessor):
@@ -124,8 +590,18 @@ class TextProcessor(DataProcessor):
     Attributes:
         length: Length of the processed text.
         words: Number of words in the processed text.
+        CHUNK_SIZE: Bytes read at once from a file object.
+        WORD: Pattern matching a word in str chunks.
+        WORD_BYTES: Pattern matching a word in bytes chunks.
+        UTF8_CONTINUATION: Pattern matching runs of bytes that do not
+            start a UTF-8 character.
     """
 
+    CHUNK_SIZE: int = 1 << 20
+    WORD: "re.Pattern[str]" = re.compile(r"\S+")
+    WORD_BYTES: "re.Pattern[bytes]" = re.compile(rb"\S+")
+    UTF8_CONTINUATION: "re.Pattern[bytes]" = re.compile(rb"[\x80-\xbf]+")
+
     def __init__(self) -> None:
         """Initialize TextProcessor with summary attributes."""
         super().__init__()
@@ -163,6 +639,138 @@ class TextProcessor(DataProcessor):
 
         return isinstance(data, str)
 
+    def process_stream(self, source: Any) -> str:
+        """Process text arriving in chunks
+
+        Words and characters are counted across chunk boundaries without
+        holding the whole text or building a list of words. Bytes are
+        decoded as UTF-8 for the character count and split on ASCII
+        whitespace.
+
+        Args:
+            source (Any): an iterable of str or bytes chunks, or a file
+                object opened in text or binary mode
+
+        Raises:
+            ValueError: if a chunk is neither str nor bytes
+
+        Returns:
+            str: the data processed
+        """
+
+        if hasattr(source, "read"):
+            source = self.read_chunks(source)
+        length: int = 0
+        words: int = 0
+        in_word: bool = False
+        chunks: int = 0
+        for chunk in source:
+            chars, found, in_word = self.count_chunk(chunk, in_word)
+            length += chars
+            words += found
+            chunks += 1
+        self.length = length
+        self.words = words
+        return f"Processing stream: {chunks} chunks"
+
+    def process_path(self, path: str) -> str:
+        """Process a file through a read-only memory map
+
+        The file is scanned window by window through memoryviews of the
+        mapped pages, so it is never copied into Python objects and
+        several processes can scan it while sharing the same page cache.
+
+        Args:
+            path (str): path of the UTF-8 file to process
+
+        Raises:
+            ValueError: if the file can't be opened
+
+        Returns:
+            str: the data processed
+        """
+
+        try:
+            with open(path, "rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    self.process_stream([])
+                else:
+                    with mmap.mmap(file.fileno(), 0,
+                                   access=mmap.ACCESS_READ) as mapped:
+                        self.process_stream(self.map_chunks(mapped))
+        except OSError as e:
+            raise ValueError(f"Error processing file: {e}")
+        return f"Processing file: {path}"
+
+    def map_chunks(self, mapped: mmap.mmap) -> Iterable[memoryview]:
+        """Yield windows of a memory-mapped file without copying them
+
+        Each window is released once the next one is requested, so the
+        map can be closed after the scan.
+
+        Args:
+            mapped (mmap.mmap): the mapped file
+
+        Yields:
+            memoryview: the next window of the file
+        """
+
+        with memoryview(mapped) as view:
+            for start in range(0, len(view), self.CHUNK_SIZE):
+                with view[start:start + self.CHUNK_SIZE] as window:
+                    yield window
+
+    def read_chunks(self, file: Any) -> Iterable[Union[str, bytes]]:
+        """Yield fixed-size chunks from a file object
+
+        Args:
+            file (Any): a file object opened in text or binary mode
+
+        Yields:
+            Union[str, bytes]: the next chunk of the file
+        """
+
+        while True:
+            chunk: Union[str, bytes] = file.read(self.CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def count_chunk(self, chunk: Union[str, bytes],
+                    in_word: bool) -> Tuple[int, int, bool]:
+        """Count characters and words of one chunk
+
+        Args:
+            chunk (Union[str, bytes]): the chunk to count
+            in_word (bool): whether the previous chunk ended inside a word
+
+        Raises:
+            ValueError: if the chunk is neither str nor bytes
+
+        Returns:
+            Tuple[int, int, bool]: characters, words started in the chunk
+                and whether the chunk ends inside a word
+        """
+
+        if not len(chunk):
+            return 0, 0, in_word
+        if isinstance(chunk, str):
+            chars: int = len(chunk)
+            words: int = self.WORD.subn("", chunk)[1]
+            first: Union[str, bytes] = chunk[:1]
+            last: Union[str, bytes] = chunk[-1:]
+        elif isinstance(chunk, (bytes, bytearray, memoryview)):
+            chars = len(chunk) - sum(
+                map(len, self.UTF8_CONTINUATION.findall(chunk)))
+            words = self.WORD_BYTES.subn(b"", chunk)[1]
+            first = bytes(chunk[:1])
+            last = bytes(chunk[-1:])
+        else:
+            raise ValueError("Invalid chunk for TextProcessor")
+        if in_word and not first.isspace():
+            words -= 1
+        return chars, words, not last.isspace()
+
     def format_output(self, result: str) -> str:
         """Format a string
 
@@ -178,18 +786,46 @@ class TextProcessor(DataProcessor):
 
 
 class LogProcessor(DataProcessor):
-    """Processor for log-entry dictionaries.
+    """Processor for log-entry dictionaries and raw log lines.
 
     Attributes:
         l_type: The log level type (e.g., ERROR, INFO).
         msg: The log message content.
+        levels: Number of entries seen per level in batch mode.
+        errors: Most recent ERROR messages seen in batch mode.
+        batched: Whether the last call was a batch.
+        LEVELS: Spellings of each level mapped to the counted level.
+        PREFIXES: Leading tokens of a raw line mapped to their level.
+        LINE: Pattern locating the level anywhere in a raw line.
     """
 
-    def __init__(self) -> None:
-        """Initialize LogProcessor with extracted log fields."""
+    LEVELS: Dict[str, str] = {
+        "ERROR": "ERROR",
+        "WARN": "WARN",
+        "WARNING": "WARN",
+        "INFO": "INFO",
+        "DEBUG": "DEBUG",
+    }
+    PREFIXES: Dict[str, str] = {
+        token: level
+        for name, level in LEVELS.items()
+        for token in (name, f"{name}:", f"[{name}]", f"[{name}]:")
+    }
+    LINE: "re.Pattern[str]" = re.compile(
+        r"(?:^|[\s\[])(ERROR|WARN(?:ING)?|INFO|DEBUG)\b\]?:?\s*(.*)")
+
+    def __init__(self, max_errors: int = 10) -> None:
+        """Initialize LogProcessor with extracted log fields.
+
+        Args:
+            max_errors: Number of recent ERROR messages kept in batch mode.
+        """
         super().__init__()
         self.l_type: Optional[str] = None
         self.msg: Optional[str] = None
+        self.levels: Counter[str] = Counter()
+        self.errors: deque[str] = deque(maxlen=max_errors)
+        self.batched: bool = False
 
     def process(self, data: Any) -> str:
         """Process data
@@ -206,22 +842,99 @@ class LogProcessor(DataProcessor):
 
         if not self.validate(data):
             raise ValueError("Invalid data for LogProcessor")
+        if isinstance(data, str):
+            data = dict((self.parse_line(data),))
         for key in data:
             self.l_type = key
             self.msg = data[key]
+        self.batched = False
         return f"Processing data: {data}"
 
+    def process_batch(self, records: Iterable[Any]) -> str:
+        """Process many log records at once
+
+        Levels are counted and the last ERROR messages are kept in a ring
+        buffer, so memory does not grow with the number of records.
+
+        Args:
+            records (Iterable[Any]): log dicts ({level: message}) or
+                (level, message) pairs
+
+        Raises:
+            ValueError: if a record is neither a dict nor a pair
+
+        Returns:
+            str: the data processed
+        """
+
+        count: int = 0
+        for record in records:
+            if isinstance(record, dict):
+                entries: Iterable[Any] = record.items()
+            elif isinstance(record, tuple) and len(record) == 2:
+                entries = (record,)
+            else:
+                raise ValueError("Invalid record for LogProcessor")
+            for level, msg in entries:
+                self.levels[level] += 1
+                if level == "ERROR":
+                    self.errors.append(msg)
+                self.l_type = level
+                self.msg = msg
+                count += 1
+        self.batched = True
+        return f"Processing log batch: {count} entries"
+
+    def process_lines(self, lines: Iterable[Union[str, bytes]]) -> str:
+        """Process raw log lines as a batch
+
+        Args:
+            lines (Iterable[Union[str, bytes]]): the raw lines, e.g. a
+                file object being tailed
+
+        Returns:
+            str: the data processed
+        """
+
+        return self.process_batch(self.parse_line(line) for line in lines)
+
+    def parse_line(self, line: Union[str, bytes]) -> Tuple[str, str]:
+        """Split a raw log line into its level and message
+
+        The first token is looked up in PREFIXES before falling back to a
+        full search of the line, so well-formed lines skip the regex.
+
+        Args:
+            line (Union[str, bytes]): the raw line
+
+        Returns:
+            Tuple[str, str]: the level (UNKNOWN if none is found) and the
+                message
+        """
+
+        if isinstance(line, bytes):
+            line = line.decode("utf-8", "replace")
+        line = line.strip()
+        head, _, rest = line.partition(" ")
+        level: Optional[str] = self.PREFIXES.get(head)
+        if level is not None:
+            return level, rest.lstrip()
+        found: Optional[re.Match[str]] = self.LINE.search(line)
+        if found is None:
+            return "UNKNOWN", line
+        return self.LEVELS[found.group(1)], found.group(2)
+
     def validate(self, data: Any) -> bool:
-        """Check if data if a dict
+        """Check if data if a dict or a raw log line
 
         Args:
             data (Any): data to validate
 
         Returns:
-            bool: true if dict false either
+            bool: true if dict or str false either
         """
 
-        return isinstance(data, dict)
+        return isinstance(data, (dict, str))
 
     def format_output(self, result: str) -> str:
         """Format a string
@@ -233,12 +946,427 @@ class LogProcessor(DataProcessor):
             str: the final output
         """
 
+        if self.batched:
+            return result + self.format_summary()
         if self.l_type == "ERROR":
             return result + f"[ALERT] ERROR level detected: {self.msg}"
         elif self.l_type == "INFO":
             return result + f"[INFO] INFO level detected: {self.msg}"
         return result + f"[LOG] INFO level detected: {self.msg}"
 
+    def format_summary(self) -> str:
+        """Summarize the entries seen in batch mode
+
+        Returns:
+            str: the level histogram and the recent errors
+        """
+
+        histogram: str = ", ".join(
+            f"{level}={n}" for level, n in self.levels.most_common())
+        if self.levels["ERROR"] == 0:
+            return f"[LOG] {sum(self.levels.values())} entries: {histogram}"
+        return f"[ALERT] {self.levels['ERROR']} ERROR entries " + \
+            f"({histogram}), recent: {' | '.join(map(str, self.errors))}"
+
+
+class ProcessorRegistry:
+    """Route mixed data to the processor registered for its type.
+
+    The processor of each concrete type is resolved once (exact type,
+    then its MRO, then each processor's validate) and cached, so routing
+    a heterogeneous stream costs one dict lookup per item.
+
+    Attributes:
+        processors: Processors registered per data type.
+        cache: Resolved processor per concrete type seen so far.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty ProcessorRegistry."""
+
+        self.processors: Dict[type, DataProcessor] = {}
+        self.cache: Dict[type, Optional[DataProcessor]] = {}
+
+    def register(self, data_type: Union[Type[Any], Tuple[Type[Any], ...]],
+                 processor: DataProcessor) -> None:
+        """Register a processor for one or several data types
+
+        Args:
+            data_type (Union[Type[Any], Tuple[Type[Any], ...]]): the
+                type or types handled by the processor
+            processor (DataProcessor): the processor to use
+        """
+
+        types: Tuple[Type[Any], ...] = data_type \
+            if isinstance(data_type, tuple) else (data_type,)
+        for t in types:
+            self.processors[t] = processor
+        self.cache.clear()
+
+    def lookup(self, data: Any) -> DataProcessor:
+        """Find the processor for data
+
+        Args:
+            data (Any): the data to route
+
+        Raises:
+            ValueError: if no processor handles the type of data
+
+        Returns:
+            DataProcessor: the processor for data
+        """
+
+        data_type: type = type(data)
+        try:
+            processor: Optional[DataProcessor] = self.cache[data_type]
+        except KeyError:
+            processor = self.resolve(data)
+            self.cache[data_type] = processor
+        if processor is None:
+            raise ValueError(f"No processor for {data_type.__name__}")
+        return processor
+
+    def resolve(self, data: Any) -> Optional[DataProcessor]:
+        """Find the processor for the type of data without the cache
+
+        Args:
+            data (Any): a sample of the type to resolve
+
+        Returns:
+            Optional[DataProcessor]: the processor or None if none fits
+        """
+
+        for t in type(data).__mro__:
+            if t in self.processors:
+                return self.processors[t]
+        for processor in self.processors.values():
+            if processor.validate(data):
+                return processor
+        return None
+
+    def process(self, data: Any) -> str:
+        """Process data with the processor registered for its type
+
+        Args:
+            data (Any): the data to process
+
+        Returns:
+            str: the data processed
+        """
+
+        return self.lookup(data).process(data)
+
+    def route(self, stream: Iterable[Any]
+              ) -> Iterator[Tuple[DataProcessor, str]]:
+        """Process every item of a heterogeneous stream
+
+        Args:
+            stream (Iterable[Any]): the items to process
+
+        Yields:
+            Tuple[DataProcessor, str]: the processor used and its result
+        """
+
+        for data in stream:
+            processor: DataProcessor = self.lookup(data)
+            yield processor, processor.process(data)
+
+
+def default_registry() -> ProcessorRegistry:
+    """Build a registry routing to the three standard processors
+
+    Returns:
+        ProcessorRegistry: numbers to NumericProcessor, str to
+            TextProcessor and dict to LogProcessor
+    """
+
+    registry: ProcessorRegistry = ProcessorRegistry()
+    registry.register((int, list, array, memoryview), NumericProcessor())
+    registry.register(str, TextProcessor())
+    registry.register(dict, LogProcessor())
+    return registry
+
+
+def run_processor(processor_type: Type[DataProcessor], data: Any,
+                  prefix: str) -> str:
+    """Process data with a fresh processor, meant to run in a worker
+
+    Args:
+        processor_type (Type[DataProcessor]): the processor class to use
+        data (Any): the data to process
+        prefix (str): the base message given to format_output
+
+    Returns:
+        str: the formatted output
+    """
+
+    processor: DataProcessor = processor_type()
+    processor.process(data)
+    return processor.format_output(prefix)
+
+
+class ProcessorExecutor:
+    """Run a DataProcessor over many independent inputs on a pool.
+
+    Each input gets its own processor instance so workers never share
+    state, and results are returned in input order.
+
+    Attributes:
+        processor_type: The processor class run on each input.
+        use_processes: Use a ProcessPoolExecutor instead of threads.
+        workers: Maximum number of workers, None for the pool default.
+        chunksize: Inputs sent to a worker process at once.
+    """
+
+    def __init__(self, processor_type: Type[DataProcessor],
+                 use_processes: bool = False,
+                 workers: Optional[int] = None,
+                 chunksize: int = 1) -> None:
+        """Initialize a ProcessorExecutor.
+
+        Args:
+            processor_type: The processor class run on each input.
+            use_processes: Use processes for CPU-bound work.
+            workers: Maximum number of workers.
+            chunksize: Inputs sent to a worker process at once.
+        """
+
+        self.processor_type: Type[DataProcessor] = processor_type
+        self.use_processes: bool = use_processes
+        self.workers: Optional[int] = workers
+        self.chunksize: int = chunksize
+
+    def make_pool(self) -> Executor:
+        """Create the configured pool
+
+        Returns:
+            Executor: a process or thread pool
+        """
+
+        if self.use_processes:
+            return ProcessPoolExecutor(self.workers)
+        return ThreadPoolExecutor(self.workers)
+
+    def run(self, inputs: Iterable[Any], prefix: str = "") -> List[str]:
+        """Process every input and collect the formatted outputs
+
+        Args:
+            inputs (Iterable[Any]): the independent inputs to process
+            prefix (str, optional): the base message given to
+                format_output. Defaults to "".
+
+        Raises:
+            ValueError: if an input is invalid for the processor
+
+        Returns:
+            List[str]: the outputs, in the order of inputs
+        """
+
+        inputs = list(inputs)
+        with self.make_pool() as pool:
+            return list(pool.map(run_processor,
+                                 [self.processor_type] * len(inputs),
+                                 inputs,
+                                 [prefix] * len(inputs),
+                                 chunksize=self.chunksize))
+
+
+class AsyncDataProcessor(ABC):
+    """Abstract base class for processors driven by an event loop.
+
+    Mirrors DataProcessor with awaitable process and validate so a single
+    loop can service many I/O-bound sources.
+    """
+
+    @abstractmethod
+    async def process(self, data: Any) -> str:
+        """Abstract method to process data
+
+        Args:
+            data (Any): the data to process
+
+        Returns:
+            str: the data processed
+        """
+
+        pass
+
+    @abstractmethod
+    async def validate(self, data: Any) -> bool:
+        """Check if data is valid
+
+        Args:
+            data (Any): the data to validate
+
+        Returns:
+            bool: true if data is valid false either
+        """
+
+        pass
+
+    def format_output(self, result: str) -> str:
+        """Format a string
+
+        Args:
+            result (str): the base message to output
+
+        Returns:
+            str: the final output
+        """
+
+        return f"{result}"
+
+
+class AsyncProcessorAdapter(AsyncDataProcessor):
+    """Drive a synchronous DataProcessor from asyncio sources.
+
+    Attributes:
+        processor: The wrapped processor.
+        batch_size: Lines handed to the processor at once from a reader.
+    """
+
+    def __init__(self, processor: DataProcessor,
+                 batch_size: int = 1024) -> None:
+        """Initialize an AsyncProcessorAdapter.
+
+        Args:
+            processor: The processor to drive.
+            batch_size: Lines handed to the processor at once.
+        """
+
+        self.processor: DataProcessor = processor
+        self.batch_size: int = batch_size
+
+    async def process(self, data: Any) -> str:
+        """Process data with the wrapped processor
+
+        Args:
+            data (Any): the data to process
+
+        Returns:
+            str: the data processed
+        """
+
+        return self.processor.process(data)
+
+    async def validate(self, data: Any) -> bool:
+        """Check data with the wrapped processor
+
+        Args:
+            data (Any): the data to validate
+
+        Returns:
+            bool: true if data is valid false either
+        """
+
+        return self.processor.validate(data)
+
+    def format_output(self, result: str) -> str:
+        """Format a string with the wrapped processor
+
+        Args:
+            result (str): the base message to output
+
+        Returns:
+            str: the final output
+        """
+
+        return self.processor.format_output(result)
+
+    async def consume(self, queue: "asyncio.Queue[Any]") -> List[str]:
+        """Process items from a queue until None is received
+
+        A bounded queue makes producers wait on put while the processor
+        is behind, which gives back-pressure.
+
+        Args:
+            queue (asyncio.Queue[Any]): the queue to drain
+
+        Returns:
+            List[str]: the result of each item processed
+        """
+
+        results: List[str] = []
+        while True:
+            data: Any = await queue.get()
+            try:
+                if data is None:
+                    return results
+                results.append(await self.process(data))
+            finally:
+                queue.task_done()
+
+    async def process_reader(self, reader: asyncio.StreamReader) -> str:
+        """Process a whole asyncio stream
+
+        Text is counted chunk by chunk, logs and numbers are read line by
+        line and handed over in batches of batch_size. The reader only
+        fills its buffer when it is awaited, so a slow processor slows
+        the peer down instead of buffering its data.
+
+        Args:
+            reader (asyncio.StreamReader): the stream to process
+
+        Raises:
+            ValueError: if the processor can't consume a stream
+
+        Returns:
+            str: the data processed
+        """
+
+        processor: DataProcessor = self.processor
+        if isinstance(processor, TextProcessor):
+            return await self.read_text(processor, reader)
+        if isinstance(processor, NumericProcessor) and \
+                processor.stats is None:
+            raise ValueError("NumericProcessor must be incremental")
+        if not isinstance(processor, (NumericProcessor, LogProcessor)):
+            raise ValueError(
+                f"{type(processor).__name__} can't consume a stream")
+        lines: List[bytes] = []
+        total: int = 0
+        while True:
+            line: bytes = await reader.readline()
+            if line:
+                lines.append(line)
+            if lines and (not line or len(lines) >= self.batch_size):
+                total += len(lines)
+                if isinstance(processor, LogProcessor):
+                    processor.process_lines(lines)
+                else:
+                    processor.process([int(x) for x in lines if x.strip()])
+                lines = []
+            if not line:
+                return f"Processing stream: {total} lines"
+
+    async def read_text(self, processor: TextProcessor,
+                        reader: asyncio.StreamReader) -> str:
+        """Count characters and words of an asyncio stream
+
+        Args:
+            processor (TextProcessor): the processor to fill
+            reader (asyncio.StreamReader): the stream to count
+
+        Returns:
+            str: the data processed
+        """
+
+        length: int = 0
+        words: int = 0
+        in_word: bool = False
+        chunks: int = 0
+        while True:
+            chunk: bytes = await reader.read(processor.CHUNK_SIZE)
+            if not chunk:
+                break
+            chars, found, in_word = processor.count_chunk(chunk, in_word)
+            length += chars
+            words += found
+            chunks += 1
+        processor.length = length
+        processor.words = words
+        return f"Processing stream: {chunks} chunks"
+
 
 def main() -> None:
     """Execute program.
@@ -280,15 +1408,13 @@ def main() -> None:
         print(e, end="\n\n")
 
     print("\n=== Polymorphic Processing Demo ===")
-    proc: Dict[DataProcessor, Any] = {
-        NumericProcessor(): [1, 2, 3],
-        TextProcessor(): "Hello World",
-        LogProcessor(): {"INFO": "System ready"}
-    }
+    registry: ProcessorRegistry = default_registry()
+    mixed: List[Any] = [[1, 2, 3], "Hello World", {"INFO": "System ready"}]
     print("Processing multiple data types through same interface...")
-    for i, p in enumerate(proc):
+    for i, data in enumerate(mixed):
         try:
-            p.process(proc[p])
+            p: DataProcessor = registry.lookup(data)
+            p.process(data)
             print(p.format_output(f"Result {i+1}: "), end="\n")
         except Exception as e:
             print(f"Error in processing: {e}")
@@ -1,5 +1,222 @@
+import mmap
+import operator
+import os
+import pickle
+import random
+import struct
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Union, Optional
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import (Any, List, Dict, Union, Optional, Callable, Tuple,
+                    BinaryIO, Iterable)
+
+
+class Criteria(ABC):
+    """Composable filter criteria compiled once into a fast callable.
+
+    Criteria apply to records parsed by DataStream.parse_record, which
+    are (name, value) pairs. Combine them with &, | and ~.
+
+    Attributes:
+        compiled: The callable built by compile, None until then.
+    """
+
+    def __init__(self) -> None:
+        """Initialize Criteria."""
+
+        self.compiled: Optional[Callable[[Tuple[str, Any]], bool]] = None
+
+    @abstractmethod
+    def build(self) -> Callable[[Tuple[str, Any]], bool]:
+        """Build the callable testing a record
+
+        Returns:
+            Callable[[Tuple[str, Any]], bool]: the test
+        """
+
+        pass
+
+    def compile(self) -> Callable[[Tuple[str, Any]], bool]:
+        """Return the test of the criteria, building it on first use
+
+        Returns:
+            Callable[[Tuple[str, Any]], bool]: the test
+        """
+
+        if self.compiled is None:
+            self.compiled = self.build()
+        return self.compiled
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """State pickled for worker processes, without the compiled test
+
+        Returns:
+            Dict[str, Any]: the attributes of the criteria
+        """
+
+        state: Dict[str, Any] = dict(self.__dict__)
+        state["compiled"] = None
+        return state
+
+    def __and__(self, other: "Criteria") -> "Criteria":
+        """Criteria matching records matched by both criteria"""
+
+        return AllOf(self, other)
+
+    def __or__(self, other: "Criteria") -> "Criteria":
+        """Criteria matching records matched by either criteria"""
+
+        return AnyOf(self, other)
+
+    def __invert__(self) -> "Criteria":
+        """Criteria matching records not matched by this one"""
+
+        return Not(self)
+
+
+class Predicate(Criteria):
+    """Compare one field of a record to a fixed value.
+
+    Attributes:
+        field: Field of the record, "name" or "value".
+        op: Comparison operator, one of OPERATORS.
+        value: Value the field is compared to.
+        FIELDS: Position of each field in a record.
+        OPERATORS: Function of each comparison operator.
+    """
+
+    FIELDS: Dict[str, int] = {"name": 0, "value": 1}
+    OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+        "==": operator.eq,
+        "!=": operator.ne,
+        "<": operator.lt,
+        "<=": operator.le,
+        ">": operator.gt,
+        ">=": operator.ge,
+        "in": lambda field, values: field in values,
+    }
+
+    def __init__(self, field: str, op: str, value: Any) -> None:
+        """Initialize a Predicate.
+
+        Args:
+            field: Field of the record, "name" or "value".
+            op: Comparison operator, one of OPERATORS.
+            value: Value the field is compared to.
+
+        Raises:
+            ValueError: if the field or the operator is unknown
+        """
+
+        super().__init__()
+        if field not in self.FIELDS:
+            raise ValueError(f"Unknown criteria field: {field}")
+        if op not in self.OPERATORS:
+            raise ValueError(f"Unknown criteria operator: {op}")
+        self.field: str = field
+        self.op: str = op
+        self.value: Any = value
+
+    def build(self) -> Callable[[Tuple[str, Any]], bool]:
+        """Build the callable testing a record
+
+        Returns:
+            Callable[[Tuple[str, Any]], bool]: the test
+        """
+
+        index: int = self.FIELDS[self.field]
+        compare: Callable[[Any, Any], bool] = self.OPERATORS[self.op]
+        value: Any = self.value
+        return lambda record: compare(record[index], value)
+
+
+class AllOf(Criteria):
+    """Match records matched by every criteria.
+
+    Attributes:
+        parts: The combined criteria.
+    """
+
+    def __init__(self, *parts: Criteria) -> None:
+        """Initialize AllOf.
+
+        Args:
+            parts: The criteria to combine.
+        """
+
+        super().__init__()
+        self.parts: Tuple[Criteria, ...] = parts
+
+    def build(self) -> Callable[[Tuple[str, Any]], bool]:
+        """Build the callable testing a record
+
+        Returns:
+            Callable[[Tuple[str, Any]], bool]: the test
+        """
+
+        tests: List[Callable[[Tuple[str, Any]], bool]] = [
+            part.compile() for part in self.parts]
+        return lambda record: all(test(record) for test in tests)
+
+
+class AnyOf(Criteria):
+    """Match records matched by at least one criteria.
+
+    Attributes:
+        parts: The combined criteria.
+    """
+
+    def __init__(self, *parts: Criteria) -> None:
+        """Initialize AnyOf.
+
+        Args:
+            parts: The criteria to combine.
+        """
+
+        super().__init__()
+        self.parts: Tuple[Criteria, ...] = parts
+
+    def build(self) -> Callable[[Tuple[str, Any]], bool]:
+        """Build the callable testing a record
+
+        Returns:
+            Callable[[Tuple[str, Any]], bool]: the test
+        """
+
+        tests: List[Callable[[Tuple[str, Any]], bool]] = [
+            part.compile() for part in self.parts]
+        return lambda record: any(test(record) for test in tests)
+
+
+class Not(Criteria):
+    """Match records not matched by a criteria.
+
+    Attributes:
+        part: The negated criteria.
+    """
+
+    def __init__(self, part: Criteria) -> None:
+        """Initialize Not.
+
+        Args:
+            part: The criteria to negate.
+        """
+
+        super().__init__()
+        self.part: Criteria = part
+
+    def build(self) -> Callable[[Tuple[str, Any]], bool]:
+        """Build the callable testing a record
+
+        Returns:
+            Callable[[Tuple[str, Any]], bool]: the test
+        """
+
+        test: Callable[[Tuple[str, Any]], bool] = self.part.compile()
+        return lambda record: not test(record)
 
 
 class DataStream(ABC):
@@ -11,8 +228,11 @@ class DataStream(ABC):
         stats: Dictionary storing stream statistics.
         s_id: Unique identifier for the stream.
         s_type: Type classification of the stream.
+        HIGH_PRIORITY: Criteria used for the "High-priority" string.
     """
 
+    HIGH_PRIORITY: Optional[Criteria] = None
+
     def __init__(self, s_id: str, s_type: str) -> None:
         """Initialize DataStream.
 
@@ -34,61 +254,1071 @@ class DataStream(ABC):
             data_batch (List[Any]): the data to process
 
         Returns:
-            str: The data processed
+            str: The data processed
+        """
+
+        pass
+
+    def filter_data(self, data_batch: List[Any],
+                    criteria: Optional[Union[str, Criteria]]
+                    = None) -> List[Any]:
+        """Filter data depending on optional criteria
+
+        Args:
+            data_batch (List[Any]): the data to filter
+            criteria (Optional[Union[str, Criteria]], optional): criteria
+                to filter on. Defaults to None.
+
+        Returns:
+            List[Any]: the data filtered
+        """
+
+        if criteria == "High-priority":
+            criteria = self.HIGH_PRIORITY
+        if isinstance(criteria, Criteria):
+            return self.filter_records(data_batch, criteria.compile())
+        return data_batch
+
+    def filter_records(self, data_batch: List[Any],
+                       test: Callable[[Tuple[str, Any]], bool]
+                       ) -> List[Any]:
+        """Keep the data whose parsed record passes test
+
+        Args:
+            data_batch (List[Any]): the data to filter
+            test (Callable[[Tuple[str, Any]], bool]): a compiled criteria
+
+        Raises:
+            ValueError: if a record can't be compared by the criteria
+
+        Returns:
+            List[Any]: the data filtered
+        """
+
+        parse: Callable[[Any], Tuple[str, Any]] = self.parse_record
+        try:
+            return [data for data in data_batch if test(parse(data))]
+        except TypeError as e:
+            raise ValueError(f"criteria does not apply: {e}")
+
+    def consume(self, data_batch: List[Any],
+                criteria: Optional[Union[str, Criteria]] = None,
+                append: bool = False) -> List[Any]:
+        """Filter a batch then process the data kept
+
+        Args:
+            data_batch (List[Any]): the raw batch
+            criteria (Optional[Union[str, Criteria]], optional): criteria
+                to filter on. Defaults to None.
+            append (bool, optional): add the batch to the data processed
+                so far instead of replacing it. Defaults to False.
+
+        Returns:
+            List[Any]: the data filtered
+        """
+
+        filtered, parsed = self.prepare(data_batch, criteria)
+        self.apply(parsed, append)
+        return filtered
+
+    def prepare(self, data_batch: List[Any],
+                criteria: Optional[Union[str, Criteria]] = None
+                ) -> Tuple[List[Any], Any]:
+        """Filter and parse a batch without changing the stream
+
+        The work done here depends only on the settings of the stream,
+        so it can run on a copy made by blank in another process.
+
+        Args:
+            data_batch (List[Any]): the raw batch
+            criteria (Optional[Union[str, Criteria]], optional): criteria
+                to filter on. Defaults to None.
+
+        Returns:
+            Tuple[List[Any], Any]: the data filtered and the parsed
+                batch given to apply
+        """
+
+        filtered: List[Any] = self.filter_data(data_batch, criteria)
+        return filtered, filtered
+
+    def apply(self, parsed: Any, append: bool = False) -> None:
+        """Update the stream with a batch returned by prepare
+
+        Streams whose state already spans every batch ignore append.
+
+        Args:
+            parsed (Any): the parsed batch
+            append (bool, optional): add the batch to the data processed
+                so far instead of replacing it. Defaults to False.
+        """
+
+        self.process_batch(parsed)
+
+    @abstractmethod
+    def blank(self) -> "DataStream":
+        """Return a stream with the same settings and no data
+
+        Returns:
+            DataStream: the empty stream
+        """
+
+        pass
+
+    def parse_record(self, data: Any) -> Tuple[str, Any]:
+        """Parse one item into the record seen by criteria
+
+        Args:
+            data (Any): the item to parse
+
+        Returns:
+            Tuple[str, Any]: the name and value of the item
+        """
+
+        return data, data
+
+    def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        """Return the stats of stream
+
+        Returns:
+            Dict[str, Union[str, int, float]]: the data of stream
+        """
+
+        return self.stats
+
+    def record_count(self) -> int:
+        """Return the number of records held by the stream
+
+        Returns:
+            int: the number of records
+        """
+
+        return len(self.stats)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the state of the stream as plain Python types
+
+        Returns:
+            Dict[str, Any]: the state, restored by restore
+        """
+
+        return {"stats": dict(self.stats)}
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Restore a state returned by snapshot
+
+        Args:
+            state (Dict[str, Any]): the state to restore
+        """
+
+        self.stats = dict(state["stats"])
+
+    def display_base_data(self) -> None:
+        """Print the ID and Type of stream"""
+
+        print(f"Stream ID: {self.s_id}, Type: {self.s_type}")
+
+
+class SensorWindow:
+    """Window aggregate over the readings of one sensor.
+
+    Sliding windows keep the readings still inside the window with a
+    running sum and monotonic deques for min and max, so each reading
+    costs O(1) amortized. Tumbling windows only keep the running values
+    of the open window and push a summary of each closed one.
+
+    Attributes:
+        size: Window length, in readings or in seconds.
+        tumbling: True for tumbling windows, False for sliding ones.
+        by_time: Measure size in seconds instead of readings.
+        closed: Summaries of the most recent closed tumbling windows.
+        seq: Index given to the next reading.
+        start: Time the open tumbling window started.
+        count: Readings in the open tumbling window.
+        total: Sum of the readings in the window.
+        low: Smallest reading of the open tumbling window.
+        high: Largest reading of the open tumbling window.
+        values: (index, time, reading) still inside a sliding window.
+        mins: Increasing (index, reading) candidates for the minimum.
+        maxs: Decreasing (index, reading) candidates for the maximum.
+    """
+
+    def __init__(self, size: float, tumbling: bool = False,
+                 by_time: bool = False, history: int = 16) -> None:
+        """Initialize an empty SensorWindow.
+
+        Args:
+            size: Window length, in readings or in seconds.
+            tumbling: Use tumbling windows instead of sliding ones.
+            by_time: Measure size in seconds instead of readings.
+            history: Number of closed tumbling windows kept.
+        """
+
+        if size <= 0:
+            raise ValueError("Window size must be positive")
+        self.size: float = size
+        self.tumbling: bool = tumbling
+        self.by_time: bool = by_time
+        self.closed: deque[Dict[str, float]] = deque(maxlen=history)
+        self.seq: int = 0
+        self.start: float = 0.0
+        self.count: int = 0
+        self.total: float = 0.0
+        self.low: float = 0.0
+        self.high: float = 0.0
+        self.values: deque[Tuple[int, float, float]] = deque()
+        self.mins: deque[Tuple[int, float]] = deque()
+        self.maxs: deque[Tuple[int, float]] = deque()
+
+    def push(self, value: float, now: float) -> None:
+        """Add a reading to the window
+
+        Args:
+            value (float): the reading
+            now (float): the time of the reading, in seconds
+        """
+
+        if self.tumbling:
+            self.push_tumbling(value, now)
+            return
+        self.values.append((self.seq, now, value))
+        self.total += value
+        while self.mins and self.mins[-1][1] >= value:
+            self.mins.pop()
+        self.mins.append((self.seq, value))
+        while self.maxs and self.maxs[-1][1] <= value:
+            self.maxs.pop()
+        self.maxs.append((self.seq, value))
+        self.seq += 1
+        self.expire(now)
+
+    def push_tumbling(self, value: float, now: float) -> None:
+        """Add a reading to the open tumbling window
+
+        Args:
+            value (float): the reading
+            now (float): the time of the reading, in seconds
+        """
+
+        if self.count and (self.count >= self.size if not self.by_time
+                           else now - self.start >= self.size):
+            self.closed.append(self.current())
+            self.count = 0
+        if self.count == 0:
+            self.start = now
+            self.total = 0.0
+            self.low = self.high = value
+        self.count += 1
+        self.total += value
+        self.low = min(self.low, value)
+        self.high = max(self.high, value)
+
+    def expire(self, now: float) -> None:
+        """Drop the readings that left a sliding window
+
+        Args:
+            now (float): the current time, in seconds
+        """
+
+        while self.values and (
+                now - self.values[0][1] >= self.size if self.by_time
+                else self.seq - self.values[0][0] > self.size):
+            seq, _, value = self.values.popleft()
+            self.total -= value
+            if self.mins[0][0] == seq:
+                self.mins.popleft()
+            if self.maxs[0][0] == seq:
+                self.maxs.popleft()
+
+    def current(self) -> Dict[str, float]:
+        """Summarize the open window
+
+        Returns:
+            Dict[str, float]: count, mean, min and max of the window,
+                empty if the window holds no reading
+        """
+
+        if self.tumbling:
+            if self.count == 0:
+                return {}
+            return {"count": self.count, "mean": self.total / self.count,
+                    "min": self.low, "max": self.high}
+        if not self.values:
+            return {}
+        return {"count": len(self.values),
+                "mean": self.total / len(self.values),
+                "min": self.mins[0][1], "max": self.maxs[0][1]}
+
+
+class SensorStream(DataStream):
+    """Stream handling environmental sensor readings.
+
+    SensorStream parses key:value strings (e.g., "temp:22.5") into one
+    column of readings per sensor and stores the mean of each sensor in
+    self.stats.
+
+    Attributes:
+        stats: Dictionary storing the mean reading of each sensor.
+        columns: Readings of the last batch, one array per sensor.
+        summary: Count, mean, min and max of each sensor.
+        windows: Window aggregate of each sensor across batches.
+        window: Window settings, None when windows are disabled.
+        clock: Time source used to stamp readings for time windows.
+        thresholds: Reading above which a sensor is High-priority.
+        s_id: Unique identifier for the stream.
+        s_type: Always set to "Environmental Data".
+    """
+
+    def __init__(self, s_id: str, window: Optional[float] = None,
+                 tumbling: bool = False, by_time: bool = False,
+                 thresholds: Optional[Dict[str, float]] = None) -> None:
+        """Initialize a SensorStream.
+
+        Args:
+            s_id: The stream identifier.
+            window: Window length, in readings or seconds. Defaults to
+                None, which disables windows.
+            tumbling: Use tumbling windows instead of sliding ones.
+            by_time: Measure the window in seconds instead of readings.
+            thresholds: High-priority threshold of each sensor. Defaults
+                to 50 for temp and humidity.
+        """
+
+        super().__init__(s_id, "Environmental Data")
+        self.columns: Dict[str, array] = dict()
+        self.summary: Dict[str, Dict[str, float]] = dict()
+        self.windows: Dict[str, SensorWindow] = dict()
+        self.window: Optional[Tuple[float, bool, bool]] = None
+        if window is not None:
+            if window <= 0:
+                raise ValueError("Window size must be positive")
+            self.window = (window, tumbling, by_time)
+        self.clock: Callable[[], float] = time.monotonic
+        self.thresholds: Dict[str, float] = {"temp": 50, "humidity": 50}
+        if thresholds is not None:
+            self.thresholds = dict(thresholds)
+
+    def process_batch(self, data_batch: List[Any]) -> str:
+        """Process the data
+
+        Args:
+            data_batch (List[Any]): the data to process
+
+        Returns:
+            str: The data processed
+        """
+
+        if not isinstance(data_batch, list):
+            raise TypeError("Error SensorStream data is not a list")
+        self.process_columns(self.parse_columns(data_batch))
+        return f"Processing sensor batch: {data_batch}"
+
+    def process_columns(self, columns: Dict[str, array],
+                        append: bool = False) -> None:
+        """Process readings already parsed into one column per sensor
+
+        Args:
+            columns (Dict[str, array]): the readings of each sensor
+            append (bool, optional): add the readings to those of the
+                previous batches instead of replacing them. Defaults to
+                False.
+        """
+
+        if not append:
+            self.columns = dict()
+            self.summary = dict()
+        for sensor, column in columns.items():
+            summary: Dict[str, float] = {
+                "count": len(column),
+                "mean": sum(column) / len(column),
+                "min": min(column),
+                "max": max(column),
+            }
+            previous: Optional[Dict[str, float]] = self.summary.get(sensor)
+            if previous is None:
+                self.columns[sensor] = column
+            else:
+                self.columns[sensor].extend(column)
+                count: float = previous["count"] + summary["count"]
+                summary = {
+                    "count": count,
+                    "mean": previous["mean"] + (
+                        summary["mean"] - previous["mean"]
+                    ) * summary["count"] / count,
+                    "min": min(previous["min"], summary["min"]),
+                    "max": max(previous["max"], summary["max"]),
+                }
+            self.summary[sensor] = summary
+        self.stats = {
+            sensor: values["mean"]
+            for sensor, values in self.summary.items()
+        }
+        if self.window is not None:
+            self.update_windows(columns)
+
+    def prepare(self, data_batch: List[Any],
+                criteria: Optional[Union[str, Criteria]] = None
+                ) -> Tuple[List[Any], Dict[str, array]]:
+        """Filter the readings and parse the ones kept into columns
+
+        Readings are parsed once, the columns built while filtering
+        being the parsed batch.
+
+        Args:
+            data_batch (List[Any]): the raw readings
+            criteria (Optional[Union[str, Criteria]], optional): criteria
+                to filter on. Defaults to None.
+
+        Raises:
+            ValueError: if a reading is not key:number
+
+        Returns:
+            Tuple[List[Any], Dict[str, array]]: the readings kept and
+                their columns
+        """
+
+        if not isinstance(data_batch, list):
+            raise TypeError("Error SensorStream data is not a list")
+        test: Optional[Callable[[Tuple[str, Any]], bool]] = None
+        if criteria == "High-priority":
+            test = self.above_threshold
+        elif isinstance(criteria, Criteria):
+            test = criteria.compile()
+        if test is None:
+            return data_batch, self.parse_columns(data_batch)
+        try:
+            return self.select_columns(data_batch, test)
+        except ValueError as e:
+            raise ValueError(f"Error filtering sensor data: {e}")
+
+    def apply(self, parsed: Dict[str, array], append: bool = False
+              ) -> None:
+        """Process the columns returned by prepare
+
+        Args:
+            parsed (Dict[str, array]): the readings of each sensor
+            append (bool, optional): add the readings to those of the
+                previous batches instead of replacing them. Defaults to
+                False.
+        """
+
+        self.process_columns(parsed, append)
+
+    def blank(self) -> "SensorStream":
+        """Return a stream with the same thresholds and no data
+
+        Returns:
+            SensorStream: the empty stream
+        """
+
+        return SensorStream(self.s_id, thresholds=self.thresholds)
+
+    def update_windows(self, columns: Dict[str, array]) -> None:
+        """Push new readings into the sensor windows
+
+        Args:
+            columns (Dict[str, array]): the new readings of each sensor
+        """
+
+        if self.window is None:
+            return
+        now: float = self.clock()
+        for sensor, column in columns.items():
+            window: Optional[SensorWindow] = self.windows.get(sensor)
+            if window is None:
+                window = self.windows[sensor] = SensorWindow(*self.window)
+            for value in column:
+                window.push(value, now)
+
+    def window_means(self) -> Dict[str, float]:
+        """Return the mean of each sensor window
+
+        Sliding windows report their current content, tumbling windows
+        their last closed window or the open one if none closed yet.
+
+        Returns:
+            Dict[str, float]: the window mean of each sensor
+        """
+
+        means: Dict[str, float] = dict()
+        now: float = self.clock()
+        for sensor, window in self.windows.items():
+            if window.tumbling and window.closed:
+                means[sensor] = window.closed[-1]["mean"]
+                continue
+            if window.by_time and not window.tumbling:
+                window.expire(now)
+            current: Dict[str, float] = window.current()
+            if current:
+                means[sensor] = current["mean"]
+        return means
+
+    def parse_columns(self, data_batch: List[Any]) -> Dict[str, array]:
+        """Parse key:value readings into one column per sensor
+
+        Args:
+            data_batch (List[Any]): the readings to parse
+
+        Raises:
+            ValueError: if a reading is not key:number
+
+        Returns:
+            Dict[str, array]: the readings of each sensor, in order
+        """
+
+        columns: Dict[str, array] = dict()
+        try:
+            for data in data_batch:
+                sensor, value = self.parse_record(data)
+                column: Optional[array] = columns.get(sensor)
+                if column is None:
+                    column = columns[sensor] = array("d")
+                column.append(value)
+        except ValueError as e:
+            raise ValueError(f"Processing sensor: {e}")
+        return columns
+
+    def record_count(self) -> int:
+        """Return the number of readings of the last batch and of those
+        appended to it
+
+        Returns:
+            int: the number of readings
+        """
+
+        return sum(len(column) for column in self.columns.values())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the state of the stream as plain Python types
+
+        Window aggregates are not part of the snapshot and start empty
+        after a restore.
+
+        Returns:
+            Dict[str, Any]: the state, restored by restore
+        """
+
+        state: Dict[str, Any] = super().snapshot()
+        state["columns"] = {
+            sensor: column.tobytes()
+            for sensor, column in self.columns.items()
+        }
+        state["summary"] = {
+            sensor: dict(values) for sensor, values in self.summary.items()
+        }
+        return state
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Restore a state returned by snapshot
+
+        Args:
+            state (Dict[str, Any]): the state to restore
+        """
+
+        super().restore(state)
+        self.columns = dict()
+        for sensor, raw in state["columns"].items():
+            self.columns[sensor] = array("d")
+            self.columns[sensor].frombytes(raw)
+        self.summary = {
+            sensor: dict(values)
+            for sensor, values in state["summary"].items()
+        }
+
+    def format_output(self, result: str) -> str:
+        """Filter data depending on optional criteria
+
+        Args:
+            data_batch (List[Any]): the data to filter
+            criteria (Optional[str], optional): criteria to filter on.
+                Defaults to None.
+
+        Returns:
+            List[Any]: the data filtered
+        """
+
+        tmp: str = "No temp"
+        if "temp" in self.stats:
+            tmp = str(self.stats["temp"]) + "°C"
+        output: str = result + \
+            f"{self.record_count()} readings processed, avg temp: {tmp}"
+        if self.window is not None:
+            means: str = ", ".join(
+                f"{sensor}={mean:.2f}"
+                for sensor, mean in self.window_means().items())
+            output += f", window avg: {means or 'empty'}"
+        return output
+
+    def filter_data(self, data_batch: List[Any],
+                    criteria: Optional[Union[str, Criteria]]
+                    = None) -> List[Any]:
+        """Filter data depending on optional criteria
+
+        Args:
+            data_batch (List[Any]): the data to filter
+            criteria (Optional[Union[str, Criteria]], optional): criteria
+                to filter on. Defaults to None.
+
+        Returns:
+            List[Any]: the data filtered
+        """
+
+        try:
+            if criteria == "High-priority":
+                return self.filter_records(data_batch,
+                                           self.above_threshold)
+            return super().filter_data(data_batch, criteria)
+        except ValueError as e:
+            raise ValueError(f"Error filtering sensor data: {e}")
+
+    def above_threshold(self, record: Tuple[str, Any]) -> bool:
+        """Check if a reading is above the threshold of its sensor
+
+        Args:
+            record (Tuple[str, Any]): the parsed reading
+
+        Returns:
+            bool: true if the sensor has a threshold and is above it
+        """
+
+        limit: Optional[float] = self.thresholds.get(record[0])
+        return limit is not None and record[1] > limit
+
+    def select_columns(self, data_batch: List[Any],
+                       test: Callable[[Tuple[str, Any]], bool]
+                       ) -> Tuple[List[Any], Dict[str, array]]:
+        """Keep the readings passing test and parse them into columns
+
+        Args:
+            data_batch (List[Any]): the readings to filter
+            test (Callable[[Tuple[str, Any]], bool]): a compiled criteria
+
+        Raises:
+            ValueError: if a reading is not key:number or can't be
+                compared by the criteria
+
+        Returns:
+            Tuple[List[Any], Dict[str, array]]: the readings kept and
+                their columns
+        """
+
+        filtered: List[Any] = []
+        columns: Dict[str, array] = dict()
+        for data in data_batch:
+            record: Tuple[str, float] = self.parse_record(data)
+            try:
+                kept: bool = test(record)
+            except TypeError as e:
+                raise ValueError(f"criteria does not apply: {e}")
+            if kept:
+                filtered.append(data)
+                column: Optional[array] = columns.get(record[0])
+                if column is None:
+                    column = columns[record[0]] = array("d")
+                column.append(record[1])
+        return filtered, columns
+
+    def parse_record(self, data: Any) -> Tuple[str, float]:
+        """Parse one key:value reading
+
+        Args:
+            data (Any): the reading to parse
+
+        Raises:
+            ValueError: if the reading is not key:number
+
+        Returns:
+            Tuple[str, float]: the sensor and its reading
+        """
+
+        sensor, sep, value = data.partition(":")
+        if not sep:
+            raise ValueError(f"missing ':' in {data!r}")
+        return sensor, float(value)
+
+
+class TransactionStream(DataStream):
+    """Stream handling financial transaction records.
+
+    TransactionStream parses key:value strings (e.g., "buy:100") into a
+    compact ledger of one op code byte and one int64 amount per operation,
+    keeping running buy and sell totals so the net flow is O(1). The
+    ledger grows across batches and matches what replay rebuilds from
+    the log.
+
+    Attributes:
+        stats: Dictionary storing the totals of every operation.
+        ops: Op code of each operation, see OP_CODES.
+        amounts: Amount of each operation.
+        buy_total: Sum of the buy amounts.
+        sell_total: Sum of the sell amounts.
+        s_id: Unique identifier for the stream.
+        s_type: Always set to "Financial Data".
+        log_path: Append-only log of processed operations, or None.
+        sync_every: Operations written between two fsync of the log.
+        log: The open log file, opened on first write.
+        unsynced: Operations written since the last fsync.
+        OP_CODES: Code stored for each known operation, 0 for others.
+        RECORD: Layout of one log record, op code then amount.
+    """
+
+    OP_CODES: Dict[str, int] = {"buy": 1, "sell": 2}
+    HIGH_PRIORITY: Optional[Criteria] = Predicate("value", ">", 500)
+    RECORD: struct.Struct = struct.Struct("<Bq")
+
+    def __init__(self, s_id: str, log_path: Optional[str] = None,
+                 sync_every: int = 1024) -> None:
+        """Initialize a TransactionStream.
+
+        Args:
+            s_id: The stream identifier.
+            log_path: File where processed operations are appended.
+                Defaults to None, which disables the log.
+            sync_every: Operations written between two fsync.
+        """
+
+        super().__init__(s_id, "Financial Data")
+        self.ops: array = array("B")
+        self.amounts: array = array("q")
+        self.buy_total: int = 0
+        self.sell_total: int = 0
+        self.log_path: Optional[str] = log_path
+        self.sync_every: int = sync_every
+        self.log: Optional[BinaryIO] = None
+        self.unsynced: int = 0
+
+    def process_batch(self, data_batch: List[Any]) -> str:
+        """Process the data
+
+        Args:
+            data_batch (List[Any]): the data to process
+
+        Returns:
+            str: The data processed
+        """
+
+        self.apply(self.parse_ledger(data_batch))
+        return f"Processing transaction batch: {data_batch}"
+
+    def parse_ledger(self, data_batch: List[Any]
+                     ) -> Tuple[array, array, List[int]]:
+        """Parse op:amount operations into ledger columns
+
+        Args:
+            data_batch (List[Any]): the operations to parse
+
+        Raises:
+            ValueError: if an operation is not op:integer
+
+        Returns:
+            Tuple[array, array, List[int]]: the op codes, the amounts
+                and the total amount of each op code
+        """
+
+        if not isinstance(data_batch, list):
+            raise TypeError(
+                "Error TransactionStream data is not a list")
+        ops: array = array("B")
+        amounts: array = array("q")
+        totals: List[int] = [0, 0, 0]
+        codes: Dict[str, int] = self.OP_CODES
+        try:
+            for data in data_batch:
+                op, sep, raw = data.partition(":")
+                if not sep:
+                    raise ValueError(f"missing ':' in {data!r}")
+                code: int = codes.get(op, 0)
+                amount: int = int(raw)
+                ops.append(code)
+                amounts.append(amount)
+                totals[code] += amount
+        except (ValueError, OverflowError) as e:
+            raise ValueError(f"Error processing transaction: {e}")
+        return ops, amounts, totals
+
+    def prepare(self, data_batch: List[Any],
+                criteria: Optional[Union[str, Criteria]] = None
+                ) -> Tuple[List[Any], Tuple[array, array, List[int]]]:
+        """Filter the operations and parse the ones kept
+
+        Args:
+            data_batch (List[Any]): the raw operations
+            criteria (Optional[Union[str, Criteria]], optional): criteria
+                to filter on. Defaults to None.
+
+        Raises:
+            ValueError: if an operation is not op:integer
+
+        Returns:
+            Tuple[List[Any], Tuple[array, array, List[int]]]: the
+                operations kept and their ledger columns
+        """
+
+        filtered: List[Any] = self.filter_data(data_batch, criteria)
+        return filtered, self.parse_ledger(filtered)
+
+    def apply(self, parsed: Tuple[array, array, List[int]],
+              append: bool = False) -> None:
+        """Append ledger columns returned by parse_ledger
+
+        The ledger spans every batch, so append is ignored.
+
+        Args:
+            parsed (Tuple[array, array, List[int]]): the op codes, the
+                amounts and the total amount of each op code
+            append (bool, optional): ignored. Defaults to False.
+        """
+
+        ops, amounts, totals = parsed
+        codes: Dict[str, int] = self.OP_CODES
+        self.ops.extend(ops)
+        self.amounts.extend(amounts)
+        self.buy_total += totals[codes["buy"]]
+        self.sell_total += totals[codes["sell"]]
+        self.stats = {
+            "operations": len(self.ops),
+            "buy": self.buy_total,
+            "sell": self.sell_total,
+        }
+        if self.log_path is not None:
+            self.append_log(ops, amounts)
+
+    def blank(self) -> "TransactionStream":
+        """Return a stream with no data and no log
+
+        Returns:
+            TransactionStream: the empty stream
+        """
+
+        return TransactionStream(self.s_id, sync_every=self.sync_every)
+
+    def append_log(self, ops: array, amounts: array) -> None:
+        """Append operations to the log, syncing every sync_every records
+
+        Args:
+            ops (array): the op codes to append
+            amounts (array): the amounts to append
+
+        Raises:
+            ValueError: if the log can't be written
+        """
+
+        if self.log_path is None:
+            return
+        record: struct.Struct = self.RECORD
+        buffer: bytearray = bytearray(record.size * len(ops))
+        for i in range(len(ops)):
+            record.pack_into(buffer, i * record.size, ops[i], amounts[i])
+        try:
+            if self.log is None:
+                self.log = open(self.log_path, "ab")
+            self.log.write(buffer)
+            self.unsynced += len(ops)
+            if self.unsynced >= self.sync_every:
+                self.sync()
+        except OSError as e:
+            raise ValueError(f"Error writing transaction log: {e}")
+
+    def sync(self) -> None:
+        """Flush the log and fsync it to disk"""
+
+        if self.log is None:
+            return
+        self.log.flush()
+        os.fsync(self.log.fileno())
+        self.unsynced = 0
+
+    def close(self) -> None:
+        """Sync and close the log"""
+
+        if self.log is None:
+            return
+        self.sync()
+        self.log.close()
+        self.log = None
+
+    def replay(self) -> int:
+        """Rebuild the ledger from every operation of the log
+
+        The log is scanned sequentially through a read-only memory map.
+        A partial record left by a crash at the end of the log is
+        ignored.
+
+        Raises:
+            ValueError: if the log can't be read
+
+        Returns:
+            int: the number of operations replayed
+        """
+
+        if self.log_path is None:
+            raise ValueError("TransactionStream has no log")
+        if self.log is not None:
+            self.sync()
+        ops: array = array("B")
+        amounts: array = array("q")
+        totals: List[int] = [0, 0, 0]
+        try:
+            with open(self.log_path, "rb") as file:
+                size: int = os.fstat(file.fileno()).st_size
+                size -= size % self.RECORD.size
+                if size:
+                    with mmap.mmap(file.fileno(), 0,
+                                   access=mmap.ACCESS_READ) as mapped:
+                        view: memoryview = memoryview(mapped)[:size]
+                        try:
+                            for code, amount in self.RECORD.iter_unpack(
+                                    view):
+                                ops.append(code)
+                                amounts.append(amount)
+                                totals[code] += amount
+                        finally:
+                            view.release()
+        except FileNotFoundError:
+            pass
+        except (OSError, IndexError) as e:
+            raise ValueError(f"Error replaying transaction log: {e}")
+        self.ops = ops
+        self.amounts = amounts
+        self.buy_total = totals[self.OP_CODES["buy"]]
+        self.sell_total = totals[self.OP_CODES["sell"]]
+        self.stats = {
+            "operations": len(ops),
+            "buy": self.buy_total,
+            "sell": self.sell_total,
+        }
+        return len(ops)
+
+    def record_count(self) -> int:
+        """Return the number of operations in the ledger
+
+        Returns:
+            int: the number of operations
+        """
+
+        return len(self.ops)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the state of the stream as plain Python types
+
+        Returns:
+            Dict[str, Any]: the state, restored by restore
+        """
+
+        state: Dict[str, Any] = super().snapshot()
+        state["ops"] = self.ops.tobytes()
+        state["amounts"] = self.amounts.tobytes()
+        state["buy_total"] = self.buy_total
+        state["sell_total"] = self.sell_total
+        return state
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Restore a state returned by snapshot
+
+        Args:
+            state (Dict[str, Any]): the state to restore
+        """
+
+        super().restore(state)
+        self.ops = array("B")
+        self.ops.frombytes(state["ops"])
+        self.amounts = array("q")
+        self.amounts.frombytes(state["amounts"])
+        self.buy_total = state["buy_total"]
+        self.sell_total = state["sell_total"]
+
+    def format_output(self, result: str) -> str:
+        """Filter data depending on optional criteria
+
+        Args:
+            data_batch (List[Any]): the data to filter
+            criteria (Optional[str], optional): criteria to filter on.
+                Defaults to None.
+
+        Returns:
+            List[Any]: the data filtered
         """
 
-        pass
+        net: int = self.buy_total - self.sell_total
+        symbol: str = ""
+        if net > 0:
+            symbol = "+"
+        return result + f"{len(self.ops)} operations, " + \
+            f"net flow: {symbol}{net} units"
 
-    def filter_data(self, data_batch: List[Any], criteria: Optional[str]
+    def filter_data(self, data_batch: List[Any],
+                    criteria: Optional[Union[str, Criteria]]
                     = None) -> List[Any]:
         """Filter data depending on optional criteria
 
         Args:
             data_batch (List[Any]): the data to filter
-            criteria (Optional[str], optional): criteria to filter on.
-                Defaults to None.
+            criteria (Optional[Union[str, Criteria]], optional): criteria
+                to filter on. Defaults to None.
 
         Returns:
             List[Any]: the data filtered
         """
 
-        return data_batch
+        try:
+            return super().filter_data(data_batch, criteria)
+        except ValueError as e:
+            raise ValueError(f"Error filtering transaction data: {e}")
 
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        """Return the stats of stream
+    def parse_record(self, data: Any) -> Tuple[str, int]:
+        """Parse one op:amount operation
 
-        Returns:
-            Dict[str, Union[str, int, float]]: the data of stream
-        """
+        Args:
+            data (Any): the operation to parse
 
-        return self.stats
+        Raises:
+            ValueError: if the operation is not op:integer
 
-    def display_base_data(self) -> None:
-        """Print the ID and Type of stream"""
+        Returns:
+            Tuple[str, int]: the operation and its amount
+        """
 
-        print(f"Stream ID: {self.s_id}, Type: {self.s_type}")
+        op, sep, amount = data.partition(":")
+        if not sep:
+            raise ValueError(f"missing ':' in {data!r}")
+        return op, int(amount)
 
 
-class SensorStream(DataStream):
-    """Stream handling environmental sensor readings.
+class EventStream(DataStream):
+    """Stream handling system event records.
 
-    SensorStream parses key:value strings (e.g., "temp:22.5") and stores
-    parsed numeric stats in self.stats.
+    EventStream counts events by type across batches and can keep a
+    uniform reservoir sample of the raw events, so memory does not grow
+    with the length of the stream.
 
     Attributes:
-        stats: Dictionary storing parsed sensor readings.
+        stats: Dictionary storing the number of events of each type.
+        counts: Number of events of each type.
+        total: Number of events processed.
+        reservoir: Uniform sample of the raw events, at most
+            reservoir_size of them.
+        reservoir_size: Size of the reservoir, 0 to disable it.
+        rng: Random generator used for the reservoir.
         s_id: Unique identifier for the stream.
-        s_type: Always set to "Environmental Data".
+        s_type: Always set to "System Events".
     """
 
-    def __init__(self, s_id: str) -> None:
-        """Initialize a SensorStream.
+    HIGH_PRIORITY: Optional[Criteria] = Predicate("name", "==", "error")
+
+    def __init__(self, s_id: str, reservoir_size: int = 0) -> None:
+        """Initialize an EventStream.
 
         Args:
             s_id: The stream identifier.
+            reservoir_size: Raw events kept as a sample. Defaults to 0.
         """
 
-        super().__init__(s_id, "Environmental Data")
+        super().__init__(s_id, "System Events")
+        self.counts: Counter[Any] = Counter()
+        self.total: int = 0
+        self.reservoir: List[Any] = []
+        self.reservoir_size: int = reservoir_size
+        self.rng: random.Random = random.Random()
 
     def process_batch(self, data_batch: List[Any]) -> str:
         """Process the data
@@ -100,121 +1330,136 @@ class SensorStream(DataStream):
             str: The data processed
         """
 
-        if not isinstance(data_batch, list):
-            raise TypeError("Error SensorStream data is not a list")
-        try:
-            self.stats = {
-                splited[0]: float(splited[1])
-                for splited
-                in [
-                    data.split(":")
-                    for data
-                    in data_batch
-                ]
-            }
-        except ValueError as e:
-            raise ValueError(f"Processing sensor: {e}")
-        return f"Processing sensor batch: {data_batch}"
+        self.apply(self.count_events(data_batch))
+        return f"Processing event batch: {data_batch}"
 
-    def format_output(self, result: str) -> str:
-        """Filter data depending on optional criteria
+    def count_events(self, data_batch: List[Any]
+                     ) -> Tuple[Counter, Optional[List[Any]], int]:
+        """Count the events of a batch by type
 
         Args:
-            data_batch (List[Any]): the data to filter
-            criteria (Optional[str], optional): criteria to filter on.
-                Defaults to None.
+            data_batch (List[Any]): the events to count
+
+        Raises:
+            ValueError: if an event is not hashable
 
         Returns:
-            List[Any]: the data filtered
+            Tuple[Counter, Optional[List[Any]], int]: the count of each
+                type, the events when a reservoir is kept, and the
+                number of events
         """
 
-        tmp: Union[List[float], str] = list(self.stats[temp]
-                                            for temp
-                                            in self.stats
-                                            if temp == 'temp')
-        if len(tmp) == 0:
-            tmp = "No temp"
-        else:
-            tmp = str(tmp[0]) + "°C"
-        return result + f"{len(self.stats)} readings processed, " + \
-            f"avg temp: {tmp}"
+        if not isinstance(data_batch, list):
+            raise TypeError("Error EventStream data is not a list")
+        try:
+            counts: Counter[Any] = Counter(data_batch)
+        except TypeError as e:
+            raise ValueError(f"Error processing event: {e}")
+        events: Optional[List[Any]] = None
+        if self.reservoir_size > 0:
+            events = data_batch
+        return counts, events, len(data_batch)
 
-    def filter_data(self, data_batch: List[Any], criteria: Optional[str]
-                    = None) -> List[Any]:
-        """Filter data depending on optional criteria
+    def prepare(self, data_batch: List[Any],
+                criteria: Optional[Union[str, Criteria]] = None
+                ) -> Tuple[List[Any],
+                           Tuple[Counter, Optional[List[Any]], int]]:
+        """Filter the events and count the ones kept
 
         Args:
-            data_batch (List[Any]): the data to filter
-            criteria (Optional[str], optional): criteria to filter on.
-                Defaults to None.
+            data_batch (List[Any]): the raw events
+            criteria (Optional[Union[str, Criteria]], optional): criteria
+                to filter on. Defaults to None.
+
+        Raises:
+            ValueError: if an event is not hashable
 
         Returns:
-            List[Any]: the data filtered
+            Tuple[List[Any], Tuple[Counter, Optional[List[Any]], int]]:
+                the events kept and their counts
         """
 
-        if criteria is not None:
-            if criteria == "High-priority":
-                try:
-                    filtered: List[str] = [
-                        data
-                        for data
-                        in data_batch
-                        if ("temp" in data or "humidity" in data)
-                        and float(data.split(":")[1]) > 50
-                    ]
-                    return filtered
-                except ValueError as e:
-                    raise ValueError(f"Error filtering sensor data: {e}")
-        return data_batch
+        filtered: List[Any] = self.filter_data(data_batch, criteria)
+        return filtered, self.count_events(filtered)
 
+    def apply(self, parsed: Tuple[Counter, Optional[List[Any]], int],
+              append: bool = False) -> None:
+        """Merge counts returned by count_events
 
-class TransactionStream(DataStream):
-    """Stream handling financial transaction records.
+        Counts span every batch, so append is ignored.
 
-    TransactionStream parses key:value strings (e.g., "buy:100") and stores
-    integer values of operations in self.stats with enumerated keys.
+        Args:
+            parsed (Tuple[Counter, Optional[List[Any]], int]): the count
+                of each type, the events to sample and their number
+            append (bool, optional): ignored. Defaults to False.
+        """
 
-    Attributes:
-        stats: Dictionary storing parsed transaction data.
-        s_id: Unique identifier for the stream.
-        s_type: Always set to "Financial Data".
-    """
+        counts, events, n = parsed
+        self.counts.update(counts)
+        if events is not None and self.reservoir_size > 0:
+            self.sample(events)
+        self.total += n
+        self.stats = dict(self.counts)
 
-    def __init__(self, s_id: str) -> None:
-        """Initialize a TransactionStream.
+    def blank(self) -> "EventStream":
+        """Return a stream with the same reservoir size and no data
 
-        Args:
-            s_id: The stream identifier.
+        Returns:
+            EventStream: the empty stream
         """
 
-        super().__init__(s_id, "Financial Data")
+        return EventStream(self.s_id, self.reservoir_size)
 
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Process the data
+    def sample(self, data_batch: List[Any]) -> None:
+        """Update the reservoir with a batch (Algorithm R)
 
         Args:
-            data_batch (List[Any]): the data to process
+            data_batch (List[Any]): the events of the batch
+        """
+
+        seen: int = self.total
+        for data in data_batch:
+            seen += 1
+            if len(self.reservoir) < self.reservoir_size:
+                self.reservoir.append(data)
+            else:
+                slot: int = self.rng.randrange(seen)
+                if slot < self.reservoir_size:
+                    self.reservoir[slot] = data
+
+    def record_count(self) -> int:
+        """Return the number of events processed
 
         Returns:
-            str: The data processed
+            int: the number of events
         """
 
-        if not isinstance(data_batch, list):
-            raise TypeError(
-                "Error TransactionStream data is not a list")
-        try:
-            self.stats = {
-                f"{splited[0]}_{i}": int(splited[1])
-                for i, splited
-                in enumerate([
-                    data.split(":")
-                    for data
-                    in data_batch
-                ])
-            }
-        except ValueError as e:
-            raise ValueError(f"Error processing transaction: {e}")
-        return f"Processing transaction batch: {data_batch}"
+        return self.total
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the state of the stream as plain Python types
+
+        Returns:
+            Dict[str, Any]: the state, restored by restore
+        """
+
+        state: Dict[str, Any] = super().snapshot()
+        state["counts"] = dict(self.counts)
+        state["total"] = self.total
+        state["reservoir"] = list(self.reservoir)
+        return state
+
+    def restore(self, state: Dict[str, Any]) -> None:
+        """Restore a state returned by snapshot
+
+        Args:
+            state (Dict[str, Any]): the state to restore
+        """
+
+        super().restore(state)
+        self.counts = Counter(state["counts"])
+        self.total = state["total"]
+        self.reservoir = list(state["reservoir"])
 
     def format_output(self, result: str) -> str:
         """Filter data depending on optional criteria
@@ -228,144 +1473,169 @@ class TransactionStream(DataStream):
             List[Any]: the data filtered
         """
 
-        buy: int = sum([
-            self.stats[buy]
-            for buy
-            in self.stats
-            if "buy" in buy
-        ])
-        sell: int = sum([
-            self.stats[buy]
-            for buy
-            in self.stats
-            if "sell" in buy
-        ])
-        symbol: str = ""
-        if buy - sell > 0:
-            symbol = "+"
-        return result + f"{len(self.stats)} operations, " + \
-            f"net flow: {symbol}{buy - sell} units"
+        ope: int = self.total
+        n_error: int = self.counts["error"]
+        error_str: str = "error" if n_error == 1 else "errors"
+        return result + f"{ope} events, " + \
+            f"{n_error} {error_str} detected"
 
-    def filter_data(self, data_batch: List[Any], criteria: Optional[str]
+    def filter_data(self, data_batch: List[Any],
+                    criteria: Optional[Union[str, Criteria]]
                     = None) -> List[Any]:
         """Filter data depending on optional criteria
 
         Args:
             data_batch (List[Any]): the data to filter
-            criteria (Optional[str], optional): criteria to filter on.
-                Defaults to None.
+            criteria (Optional[Union[str, Criteria]], optional): criteria
+                to filter on. Defaults to None.
 
         Returns:
             List[Any]: the data filtered
         """
 
-        if criteria is not None:
-            if criteria == "High-priority":
-                try:
-                    filtered: List[int] = [
-                        data
-                        for data
-                        in data_batch
-                        if float(data.split(":")[1]) > 500
-                    ]
-                    return filtered
-                except ValueError as e:
-                    raise ValueError(f"Error filtering transaction data: {e}")
-        return data_batch
+        try:
+            return super().filter_data(data_batch, criteria)
+        except ValueError as e:
+            raise ValueError(f"Error filtering event data: {e}")
 
 
-class EventStream(DataStream):
-    """Stream handling system event records.
+class StreamIngestor:
+    """Bounded queue between producers and a DataStream.
 
-    EventStream stores each event from the batch into self.stats using
-    event_<n> keys and supports simple event-based reporting.
+    Producers put raw items, the consumer takes them in micro-batches.
+    When the queue is full the policy decides what happens: "block"
+    waits for room, "drop-oldest" evicts the oldest queued item and
+    "drop-newest" rejects the new one.
 
     Attributes:
-        stats: Dictionary storing event data with enumerated keys.
-        s_id: Unique identifier for the stream.
-        s_type: Always set to "System Events".
+        stream: The stream fed by the queue.
+        capacity: Maximum number of queued items.
+        policy: Behaviour when the queue is full, one of POLICIES.
+        batch_size: Maximum number of items per micro-batch.
+        queue: The queued items.
+        dropped: Number of items dropped by the policy.
+        accepted: Number of items queued.
+        max_depth: Largest number of items queued at once.
+        ready: Condition guarding the queue.
+        POLICIES: The supported policies.
     """
 
-    def __init__(self, s_id: str) -> None:
-        """Initialize an EventStream.
+    POLICIES: Tuple[str, ...] = ("block", "drop-oldest", "drop-newest")
+
+    def __init__(self, stream: DataStream, capacity: int = 1024,
+                 policy: str = "block", batch_size: int = 64) -> None:
+        """Initialize a StreamIngestor.
 
         Args:
-            s_id: The stream identifier.
-        """
+            stream: The stream fed by the queue.
+            capacity: Maximum number of queued items.
+            policy: Behaviour when the queue is full.
+            batch_size: Maximum number of items per micro-batch.
 
-        super().__init__(s_id, "System Events")
+        Raises:
+            ValueError: if the policy is unknown or a size not positive
+        """
 
-    def process_batch(self, data_batch: List[Any]) -> str:
-        """Process the data
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown ingestion policy: {policy}")
+        if capacity < 1 or batch_size < 1:
+            raise ValueError("Capacity and batch size must be positive")
+        self.stream: DataStream = stream
+        self.capacity: int = capacity
+        self.policy: str = policy
+        self.batch_size: int = batch_size
+        self.queue: deque[Any] = deque()
+        self.dropped: int = 0
+        self.accepted: int = 0
+        self.max_depth: int = 0
+        self.ready: threading.Condition = threading.Condition()
+
+    def put(self, data: Any, timeout: Optional[float] = None) -> bool:
+        """Queue one raw item
 
         Args:
-            data_batch (List[Any]): the data to process
+            data (Any): the item to queue
+            timeout (Optional[float], optional): seconds to wait for room
+                with the "block" policy. Defaults to None, wait forever.
 
         Returns:
-            str: The data processed
+            bool: true if the item was queued false if it was dropped
         """
 
-        if not isinstance(data_batch, list):
-            raise TypeError("Error EventStream data is not a list")
-        try:
-            self.stats.update({
-                f"event_{i+1}": data
-                for i, data
-                in enumerate(data_batch)
-            })
-        except ValueError as e:
-            raise ValueError(f"Error processing event: {e}")
-        return f"Processing event batch: {data_batch}"
-
-    def format_output(self, result: str) -> str:
-        """Filter data depending on optional criteria
-
-        Args:
-            data_batch (List[Any]): the data to filter
-            criteria (Optional[str], optional): criteria to filter on.
-                Defaults to None.
+        with self.ready:
+            if len(self.queue) >= self.capacity:
+                if self.policy == "drop-newest":
+                    self.dropped += 1
+                    return False
+                if self.policy == "drop-oldest":
+                    self.queue.popleft()
+                    self.dropped += 1
+                elif not self.ready.wait_for(
+                        lambda: len(self.queue) < self.capacity, timeout):
+                    self.dropped += 1
+                    return False
+            self.queue.append(data)
+            self.accepted += 1
+            self.max_depth = max(self.max_depth, len(self.queue))
+            self.ready.notify_all()
+            return True
+
+    def take(self) -> List[Any]:
+        """Take the next micro-batch without waiting
 
         Returns:
-            List[Any]: the data filtered
+            List[Any]: up to batch_size items, empty if none is queued
         """
 
-        ope: int = len(self.stats)
-        n_error: int = len([
-            self.stats[error]
-            for error
-            in self.stats
-            if self.stats[error] == "error"
-        ])
-        error_str: str = "error" if n_error == 1 else "errors"
-        return result + f"{ope} events, " + \
-            f"{n_error} {error_str} detected"
+        with self.ready:
+            count: int = min(self.batch_size, len(self.queue))
+            batch: List[Any] = [self.queue.popleft() for _ in range(count)]
+            if batch:
+                self.ready.notify_all()
+            return batch
 
-    def filter_data(self, data_batch: List[Any], criteria: Optional[str]
-                    = None) -> List[Any]:
-        """Filter data depending on optional criteria
+    @property
+    def depth(self) -> int:
+        """Number of items currently queued"""
 
-        Args:
-            data_batch (List[Any]): the data to filter
-            criteria (Optional[str], optional): criteria to filter on.
-                Defaults to None.
+        return len(self.queue)
+
+    def get_counters(self) -> Dict[str, int]:
+        """Return the queue counters
 
         Returns:
-            List[Any]: the data filtered
+            Dict[str, int]: accepted, dropped, depth and max_depth
         """
 
-        if criteria is not None:
-            if criteria == "High-priority":
-                try:
-                    filtered: List[str] = [
-                        data
-                        for data
-                        in data_batch
-                        if data == "error"
-                    ]
-                    return filtered
-                except ValueError as e:
-                    raise ValueError(f"Error filtering event data: {e}")
-        return data_batch
+        with self.ready:
+            return {
+                "accepted": self.accepted,
+                "dropped": self.dropped,
+                "depth": len(self.queue),
+                "max_depth": self.max_depth,
+            }
+
+
+def prepare_stream(stream: DataStream, data_batch: List[Any],
+                   criteria: Optional[Union[str, Criteria]]
+                   ) -> Tuple[Optional[List[Any]], Any]:
+    """Filter and parse one batch, meant to run in a worker process
+
+    Args:
+        stream (DataStream): a blank copy of the stream
+        data_batch (List[Any]): the raw batch of the stream
+        criteria (Optional[Union[str, Criteria]]): the criteria to
+            filter the data
+
+    Returns:
+        Tuple[Optional[List[Any]], Any]: the filtered batch, None when
+            nothing was filtered out, and the parsed batch
+    """
+
+    filtered, parsed = stream.prepare(data_batch, criteria)
+    if filtered is data_batch:
+        return None, parsed
+    return filtered, parsed
 
 
 class StreamProcessor:
@@ -373,23 +1643,120 @@ class StreamProcessor:
 
     Accepts a mapping of DataStream -> list of raw batch items and applies
     filtering and processing for each registered stream.
+
+    Attributes:
+        workers: Streams processed at the same time, 1 for serial.
+        pool: Process pool of the workers, created on first use and
+            shut down by close.
+        offsets: Raw items consumed so far by each stream id.
+        ingestors: Bounded queue attached to each stream id.
+        CHECKPOINT_VERSION: Format version written in checkpoints.
     """
 
-    def __init__(self) -> None:
-        """Initialize a StreamProcessor instance."""
+    CHECKPOINT_VERSION: int = 1
 
-        pass
+    def __init__(self, workers: int = 1) -> None:
+        """Initialize a StreamProcessor instance.
+
+        Args:
+            workers: Streams prepared at the same time on a process pool.
+                Defaults to 1, which processes them serially.
+        """
+
+        if workers < 1:
+            raise ValueError("StreamProcessor needs at least one worker")
+        self.workers: int = workers
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.offsets: Dict[str, int] = dict()
+        self.ingestors: Dict[str, StreamIngestor] = dict()
+
+    def __enter__(self) -> "StreamProcessor":
+        """Use the processor as a context manager closing its pool
+
+        Returns:
+            StreamProcessor: the processor itself
+        """
+
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the processor when leaving the context"""
+
+        self.close()
+
+    def get_pool(self) -> ProcessPoolExecutor:
+        """Return the process pool of the workers, starting it once
+
+        Returns:
+            ProcessPoolExecutor: the pool, kept until close
+        """
+
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(self.workers)
+        return self.pool
+
+    def close(self) -> None:
+        """Shut down the process pool, a later call starts a new one"""
+
+        if self.pool is None:
+            return
+        self.pool.shutdown()
+        self.pool = None
+
+    def advance(self, s_id: str, count: int) -> None:
+        """Count raw items applied to a stream in its offset
+
+        Offsets are advanced as soon as a stream has applied its batch,
+        so a checkpoint never pairs a stream state with an older offset.
+
+        Args:
+            s_id (str): the id of the stream
+            count (int): the number of raw items applied
+        """
+
+        self.offsets[s_id] = self.offsets.get(s_id, 0) + count
+
+    def run_stream(self, stream: DataStream, data_batch: List[Any],
+                   criteria: Optional[Union[str, Criteria]],
+                   append: bool = False) -> List[Any]:
+        """Filter then process the batch of one stream
+
+        Args:
+            stream (DataStream): the stream to feed
+            data_batch (List[Any]): the raw batch of the stream
+            criteria (Optional[Union[str, Criteria]]): the criteria to
+                filter the data
+            append (bool, optional): add the batch to the data processed
+                so far instead of replacing it. Defaults to False.
+
+        Returns:
+            List[Any]: the filtered batch
+        """
+
+        return stream.consume(data_batch, criteria, append)
 
     def process_stream(self, streams: Dict[DataStream,
                                            List[Any]],
-                       criteria: Optional[str] = None) -> str:
+                       criteria: Optional[Union[str, Criteria]] = None
+                       ) -> str:
         """Process all streams
 
         Args:
             streams (Dict[Union[EventStream, TransactionStream, SensorStream],
                 Union[str, float, int]]): the streams to process
-            criteria (Optional[str], optional): the criteria to
-                filter the data. Defaults to None.
+            criteria (Optional[Union[str, Criteria]], optional): the
+                criteria to filter the data. Defaults to None.
+
+        Streams are independent, so with more than one worker they are
+        filtered and parsed concurrently by worker processes, each on a
+        blank copy of its stream. The parsed batches are then applied to
+        the streams in order, so the output does not depend on
+        scheduling. The pool is kept across calls until close. Batches
+        are pickled to and from the workers, which only pays off for
+        large batches on several cores.
+
+        Counts cover the items this call applied to each stream, not the
+        lifetime totals of the streams.
 
         Raises:
             ValueError: if data can't be parsed
@@ -401,18 +1768,32 @@ class StreamProcessor:
         sensor: int = 0
         trans: int = 0
         event: int = 0
-        for s in streams:
-            try:
-                streams[s] = s.filter_data(streams[s], criteria)
-                s.process_batch(streams[s])
-                if isinstance(s, SensorStream):
-                    sensor += len(s.get_stats())
-                if isinstance(s, TransactionStream):
-                    trans += len(s.get_stats())
-                if isinstance(s, EventStream):
-                    event += len(s.get_stats())
-            except ValueError as e:
-                raise ValueError(f"Error: {e}")
+        filtered: List[List[Any]] = []
+        try:
+            if self.workers > 1 and len(streams) > 1:
+                prepared: List[Tuple[Optional[List[Any]], Any]] = list(
+                    self.get_pool().map(prepare_stream,
+                                        [s.blank() for s in streams],
+                                        streams.values(),
+                                        [criteria] * len(streams)))
+                for s, (batch, parsed) in zip(streams, prepared):
+                    s.apply(parsed)
+                    self.advance(s.s_id, len(streams[s]))
+                    filtered.append(streams[s] if batch is None else batch)
+            else:
+                for s in streams:
+                    filtered.append(self.run_stream(s, streams[s], criteria))
+                    self.advance(s.s_id, len(streams[s]))
+        except ValueError as e:
+            raise ValueError(f"Error: {e}")
+        for s, batch in zip(list(streams), filtered):
+            streams[s] = batch
+            if isinstance(s, SensorStream):
+                sensor += len(batch)
+            if isinstance(s, TransactionStream):
+                trans += len(batch)
+            if isinstance(s, EventStream):
+                event += len(batch)
         if criteria is not None:
             if criteria == "High-priority":
                 to_return: str = "Filtered results: "
@@ -428,6 +1809,138 @@ class StreamProcessor:
             f"- Transaction data: {trans} operations processed\n" + \
             f"- Event data: {event} events processed"
 
+    def attach(self, stream: DataStream, capacity: int = 1024,
+               policy: str = "block",
+               batch_size: int = 64) -> StreamIngestor:
+        """Attach a bounded queue in front of a stream
+
+        Args:
+            stream (DataStream): the stream to feed
+            capacity (int, optional): maximum number of queued items.
+                Defaults to 1024.
+            policy (str, optional): behaviour when the queue is full.
+                Defaults to "block".
+            batch_size (int, optional): maximum number of items per
+                micro-batch. Defaults to 64.
+
+        Returns:
+            StreamIngestor: the queue producers put items into
+        """
+
+        ingestor: StreamIngestor = StreamIngestor(stream, capacity, policy,
+                                                  batch_size)
+        self.ingestors[stream.s_id] = ingestor
+        return ingestor
+
+    def pump(self, criteria: Optional[Union[str, Criteria]] = None
+             ) -> Dict[str, int]:
+        """Drain every attached queue in micro-batches
+
+        Each micro-batch is filtered and processed like a batch given to
+        process_stream and counts in the stream offset. Micro-batches
+        after the first one of a drain are appended to it, so the stats
+        of a stream cover everything the pump drained.
+
+        Args:
+            criteria (Optional[Union[str, Criteria]], optional): the
+                criteria to filter the data. Defaults to None.
+
+        Raises:
+            ValueError: if data can't be parsed
+
+        Returns:
+            Dict[str, int]: raw items processed per stream id
+        """
+
+        processed: Dict[str, int] = dict()
+        for s_id, ingestor in self.ingestors.items():
+            processed[s_id] = 0
+            batch: List[Any] = ingestor.take()
+            while batch:
+                try:
+                    self.run_stream(ingestor.stream, batch, criteria,
+                                    processed[s_id] > 0)
+                except ValueError as e:
+                    raise ValueError(f"Error: {e}")
+                processed[s_id] += len(batch)
+                self.advance(s_id, len(batch))
+                batch = ingestor.take()
+        return processed
+
+    def checkpoint(self, path: str, streams: Iterable[DataStream]) -> None:
+        """Save the state and offset of each stream to a binary file
+
+        The file is written next to path then renamed over it, so a crash
+        never leaves a partial checkpoint behind.
+
+        Args:
+            path (str): the checkpoint file
+            streams (Iterable[DataStream]): the streams to save
+
+        Raises:
+            ValueError: if the checkpoint can't be written
+        """
+
+        snapshot: Dict[str, Any] = {
+            "version": self.CHECKPOINT_VERSION,
+            "offsets": dict(self.offsets),
+            "streams": {
+                s.s_id: {"type": type(s).__name__, "state": s.snapshot()}
+                for s in streams
+            },
+        }
+        tmp: str = f"{path}.tmp"
+        try:
+            with open(tmp, "wb") as file:
+                pickle.dump(snapshot, file, pickle.HIGHEST_PROTOCOL)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(tmp, path)
+        except OSError as e:
+            raise ValueError(f"Error writing checkpoint: {e}")
+
+    def resume(self, path: str,
+               streams: Iterable[DataStream]) -> Dict[str, int]:
+        """Restore the streams and offsets saved by checkpoint
+
+        Only load checkpoints written by a trusted process, they are
+        unpickled. Streams missing from the checkpoint are left as is.
+
+        Args:
+            path (str): the checkpoint file
+            streams (Iterable[DataStream]): the streams to restore
+
+        Raises:
+            ValueError: if the checkpoint is unreadable or does not match
+                the type of a stream
+
+        Returns:
+            Dict[str, int]: raw items already consumed per stream id, to
+                skip when replaying the tail, empty if there is no
+                checkpoint
+        """
+
+        try:
+            with open(path, "rb") as file:
+                snapshot: Dict[str, Any] = pickle.load(file)
+        except FileNotFoundError:
+            return dict()
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            raise ValueError(f"Error reading checkpoint: {e}")
+        if snapshot.get("version") != self.CHECKPOINT_VERSION:
+            raise ValueError("Error reading checkpoint: unknown version")
+        saved: Dict[str, Any] = snapshot["streams"]
+        for s in streams:
+            if s.s_id not in saved:
+                continue
+            if saved[s.s_id]["type"] != type(s).__name__:
+                raise ValueError(
+                    f"Error reading checkpoint: {s.s_id} is not a "
+                    f"{type(s).__name__}")
+            s.restore(saved[s.s_id]["state"])
+        self.offsets = dict(snapshot["offsets"])
+        return dict(self.offsets)
+
 
 def main() -> None:
     """Execute program"""
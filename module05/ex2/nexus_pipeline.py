@@ -1,6 +1,14 @@
+import csv
+import json
+import multiprocessing
+import queue
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict, Protocol
+from typing import (Any, List, Dict, Protocol, Iterable, Iterator, Optional,
+                    Callable, Union, IO, Tuple)
 from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
 
 
 class ProcessingStage(Protocol):
@@ -31,6 +39,7 @@ class ProcessingPipeline(ABC):
     Attributes:
         pipeline_id: Unique identifier for the pipeline.
         stages: List of processing stages in execution order.
+        plans: Fused plan per input type once compiled, None before.
     """
 
     def __init__(self, pipeline_id: str) -> None:
@@ -41,6 +50,7 @@ class ProcessingPipeline(ABC):
         """
         self.pipeline_id: str = pipeline_id
         self.stages: List[ProcessingStage] = []
+        self.plans: Optional[Dict[type, Callable[[Any], Any]]] = None
 
     def add_stage(self, stage: ProcessingStage) -> None:
         """Add a processing stage to the pipeline.
@@ -49,6 +59,84 @@ class ProcessingPipeline(ABC):
             stage: The processing stage to add.
         """
         self.stages.append(stage)
+        if self.plans is not None:
+            self.plans.clear()
+
+    def compile(self) -> "ProcessingPipeline":
+        """Switch the pipeline to fused execution plans.
+
+        For each input type, the branch of every stage with a specialize
+        method is resolved once and adjacent ones are fused into a single
+        callable, cached per type. Stages without specialize run their
+        process method. Like stream, fused plans do not log each stage.
+
+        Returns:
+            The pipeline itself.
+        """
+        self.plans = {}
+        return self
+
+    def plan(self, data_type: type) -> Callable[[Any], Any]:
+        """Return the fused plan for an input type, building it once.
+
+        Args:
+            data_type: The type of the input data.
+
+        Returns:
+            The callable running every stage on data of that type.
+        """
+        if self.plans is None:
+            self.plans = {}
+        fused: Optional[Callable[[Any], Any]] = self.plans.get(data_type)
+        if fused is None:
+            fused = self.plans[data_type] = self.build_plan(data_type)
+        return fused
+
+    def build_plan(self, data_type: type) -> Callable[[Any], Any]:
+        """Fuse the stages for an input type.
+
+        The type returned by each branch selects the branch of the next
+        stage. When it depends on the data, later stages pick their
+        branch per record from a per-type cache.
+
+        Args:
+            data_type: The type of the input data.
+
+        Returns:
+            The callable running every stage on data of that type.
+        """
+        steps: List[Callable[[Any], Any]] = []
+        current: Optional[type] = data_type
+        for stage in self.stages:
+            specialize: Optional[Callable[[type], Any]] = getattr(
+                stage, "specialize", None)
+            if specialize is None:
+                steps.append(stage.process)
+                current = None
+            elif current is None:
+                steps.append(dispatch_by_type(specialize))
+            else:
+                step, current = specialize(current)
+                if step is not identity:
+                    steps.append(step)
+        return fuse_steps(steps)
+
+    def run_stages(self, data: Any) -> Any:
+        """Run data through every stage.
+
+        Uses the fused plan of the type of data once compiled.
+
+        Args:
+            data: The data to process.
+
+        Returns:
+            The processed data.
+        """
+        if self.plans is not None:
+            return self.plan(type(data))(data)
+        for stage in self.stages:
+            data = stage.process(data)
+        return data
 
     @abstractmethod
     def process(self, data: Any) -> Any:
@@ -62,6 +150,100 @@ class ProcessingPipeline(ABC):
         """
         ...
 
+    def stream(self, records: Iterable[Any],
+               batch_size: Optional[int] = None) -> Iterator[Any]:
+        """Stream records through all stages one at a time.
+
+        Stages are chained as generators, so only the records in flight
+        are held in memory whatever the size of the input. Stages with a
+        stream method use it, the others have process mapped over the
+        records. A compiled pipeline runs its fused plans instead.
+
+        Args:
+            records: The records to process, consumed lazily.
+            batch_size: Pull records in micro-batches of this size and
+                run each stage over a whole micro-batch before the next
+                stage. Outputs are still yielded one per record. Defaults
+                to None, which sends records one by one.
+
+        Returns:
+            An iterator over the processed records.
+        """
+        flow: Iterator[Any] = iter(records)
+        if batch_size is not None:
+            return chain.from_iterable(
+                map(self.run_batch, micro_batches(flow, batch_size)))
+        if self.plans is not None:
+            return map(self.run_stages, flow)
+        for stage in self.stages:
+            stream = getattr(stage, "stream", None)
+            if stream is not None:
+                flow = stream(flow)
+            else:
+                flow = map(stage.process, flow)
+        return flow
+
+    def run_batch(self, batch: List[Any]) -> List[Any]:
+        """Run every record of a micro-batch through the stages.
+
+        Each stage handles the records of the batch, never the batch
+        itself, before the next stage starts.
+
+        Args:
+            batch: The records of the micro-batch.
+
+        Returns:
+            The output of each record, in order.
+        """
+        if self.plans is not None:
+            return [self.run_stages(record) for record in batch]
+        for stage in self.stages:
+            stream = getattr(stage, "stream", None)
+            if stream is not None:
+                batch = list(stream(batch))
+            else:
+                batch = [stage.process(record) for record in batch]
+        return batch
+
+    def pipelined(self, records: Iterable[Any], use_processes: bool = False,
+                  capacity: int = 64) -> Iterator[Any]:
+        """Stream records with every stage running on its own worker.
+
+        Stages are connected by bounded queues so parsing, enrichment and
+        formatting overlap, and throughput approaches that of the slowest
+        stage. Records keep their order. An error raised by a stage is
+        raised again here once the records before it are yielded.
+
+        Args:
+            records: The records to process, consumed lazily.
+            use_processes: Run stages in processes instead of threads.
+                Stages must then be picklable.
+            capacity: Maximum number of records waiting between stages.
+
+        Returns:
+            An iterator over the processed records.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity < 1:
+            raise ValueError("Queue capacity must be positive")
+        make_queue: Callable[[], Any] = (
+            (lambda: multiprocessing.Queue(capacity)) if use_processes
+            else (lambda: queue.Queue(capacity))
+        )
+        queues: List[Any] = [make_queue() for _ in range(len(self.stages) + 1)]
+        workers: List[Any] = [
+            (multiprocessing.Process if use_processes else threading.Thread)(
+                target=run_stage, args=(stage, queues[i], queues[i + 1]),
+                daemon=True)
+            for i, stage in enumerate(self.stages)
+        ]
+        stop: threading.Event = threading.Event()
+        feeder: threading.Thread = threading.Thread(
+            target=feed_queue, args=(records, queues[0], stop), daemon=True)
+        return collect_queue(queues[-1], [*workers, feeder], stop)
+
     def get_id(self) -> str:
         """Get the pipeline's unique identifier.
 
@@ -71,6 +253,508 @@ class ProcessingPipeline(ABC):
         return self.pipeline_id
 
 
+def micro_batches(records: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Group records into lists of at most size records.
+
+    Args:
+        records: The records to group.
+        size: The maximum number of records per list.
+
+    Returns:
+        An iterator over the lists of records.
+
+    Raises:
+        ValueError: If size is not positive.
+    """
+    if size < 1:
+        raise ValueError("Batch size must be positive")
+    flow: Iterator[Any] = iter(records)
+    batch: List[Any] = list(islice(flow, size))
+    while batch:
+        yield batch
+        batch = list(islice(flow, size))
+
+
+class ColumnBatch(dict):
+    """Batch of CSV rows stored column by column.
+
+    Maps each column name to the typed values of that column.
+
+    Attributes:
+        rows: Number of rows in the batch.
+    """
+
+    def __init__(self, columns: List[str]) -> None:
+        """Initialize an empty batch.
+
+        Args:
+            columns: The column names, in file order.
+        """
+        super().__init__((name, []) for name in columns)
+        self.rows: int = 0
+
+
+class CSVSource:
+    """Lazy, chunked reader of CSV files for CSVAdapter.
+
+    Rows are parsed with the csv module while the file is read and are
+    yielded as ColumnBatch objects of at most batch_size rows, so files of
+    any size go through the pipeline in constant memory.
+
+    Attributes:
+        source: Path of the file or an open text file object.
+        batch_size: Maximum number of rows per batch.
+        header: Whether the first row holds the column names.
+        types: Converter of each column by name. Other columns get one
+            type for the whole file, int, float or str, inferred from the
+            values of the first batch.
+        dialect: Keyword arguments given to csv.reader.
+    """
+
+    def __init__(self, source: Union[str, IO[str]], batch_size: int = 1024,
+                 header: bool = True,
+                 types: Optional[Dict[str, Callable[[str], Any]]] = None,
+                 **dialect: Any) -> None:
+        """Initialize a CSVSource.
+
+        Args:
+            source: Path of the file or an open text file object.
+            batch_size: Maximum number of rows per batch.
+            header: Whether the first row holds the column names.
+            types: Converter of some columns, by name.
+            dialect: Keyword arguments given to csv.reader.
+
+        Raises:
+            ValueError: If batch_size is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be positive")
+        self.source: Union[str, IO[str]] = source
+        self.batch_size: int = batch_size
+        self.header: bool = header
+        self.types: Dict[str, Callable[[str], Any]] = dict(types or {})
+        self.dialect: Dict[str, Any] = dialect
+
+    def __iter__(self) -> Iterator[ColumnBatch]:
+        """Read the source batch by batch.
+
+        Returns:
+            An iterator over the column batches.
+
+        Raises:
+            ValueError: If the file can't be read or a row is malformed.
+        """
+        if isinstance(self.source, str):
+            try:
+                with open(self.source, newline="") as file:
+                    yield from self.read(file)
+            except OSError as e:
+                raise ValueError(f"Error reading CSV: {e}")
+        else:
+            yield from self.read(self.source)
+
+    def read(self, file: IO[str]) -> Iterator[ColumnBatch]:
+        """Parse an open file batch by batch.
+
+        Args:
+            file: The text file to parse.
+
+        Returns:
+            An iterator over the column batches.
+
+        Raises:
+            ValueError: If column names repeat, a row is malformed or a
+                value doesn't fit the type of its column.
+        """
+        reader: Any = csv.reader(file, **self.dialect)
+        try:
+            first: Optional[List[str]] = next(reader, None)
+            if first is None:
+                return
+            names: List[str] = first if self.header \
+                else [f"col{i}" for i in range(len(first))]
+            if len(set(names)) != len(names):
+                duplicates: List[str] = sorted(
+                    {name for name in names if names.count(name) > 1})
+                raise ValueError(
+                    f"duplicate column names: {', '.join(duplicates)}")
+            converters: List[Optional[Callable[[str], Any]]] = [
+                self.types.get(name) for name in names
+            ]
+            rows: Iterator[List[str]] = reader
+            if not self.header:
+                rows = chain([first], reader)
+            while True:
+                raw: List[List[str]] = []
+                lines: List[int] = []
+                for row in islice(rows, self.batch_size):
+                    if len(row) != len(names):
+                        raise ValueError(
+                            f"line {reader.line_num}: expected "
+                            f"{len(names)} fields, got {len(row)}")
+                    raw.append(row)
+                    lines.append(reader.line_num)
+                if not raw:
+                    return
+                batch: ColumnBatch = ColumnBatch(names)
+                for i, values in enumerate(zip(*raw)):
+                    convert: Optional[Callable[[str], Any]] = converters[i]
+                    if convert is None:
+                        convert = converters[i] = infer_type(values)
+                    batch[names[i]] = convert_column(names[i], convert,
+                                                     values, lines)
+                batch.rows = len(raw)
+                yield batch
+        except csv.Error as e:
+            raise ValueError(f"Error reading CSV: {e}")
+
+
+def infer_type(values: Tuple[str, ...]) -> Callable[[str], Any]:
+    """Pick the narrowest type that fits every value of a column.
+
+    Numbers written with a leading zero, like codes or zip codes, keep
+    their column as str so that the zero isn't lost.
+
+    Args:
+        values: The raw values of the column.
+
+    Returns:
+        int, float or str.
+    """
+    for value in values:
+        digits: str = value.strip().lstrip("+-")
+        if len(digits) > 1 and digits[0] == "0" and digits[1].isdigit():
+            return str
+    for convert in (int, float):
+        try:
+            for value in values:
+                convert(value)
+        except ValueError:
+            continue
+        return convert
+    return str
+
+
+def convert_column(name: str, convert: Callable[[str], Any],
+                   values: Tuple[str, ...], lines: List[int]) -> List[Any]:
+    """Convert the raw values of a column with its converter.
+
+    Args:
+        name: The column name.
+        convert: The converter of the column.
+        values: The raw values of the column.
+        lines: The line number of each value.
+
+    Returns:
+        The converted values.
+
+    Raises:
+        ValueError: If a value doesn't fit the column type.
+    """
+    try:
+        return list(map(convert, values))
+    except ValueError:
+        for line, value in zip(lines, values):
+            try:
+                convert(value)
+            except ValueError as e:
+                raise ValueError(f"line {line}: column {name}: {e}")
+        raise
+
+
+DECODER: json.JSONDecoder = json.JSONDecoder()
+
+
+def decode_lines(lines: List[Union[str, bytes]]) -> List[Any]:
+    """Decode NDJSON lines with the shared decoder, skipping blank ones.
+
+    Module level so it can run in worker processes.
+
+    Args:
+        lines: The raw lines.
+
+    Returns:
+        The decoded records, in order.
+
+    Raises:
+        ValueError: If a line is not valid JSON.
+    """
+    records: List[Any] = []
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.strip()
+        if line:
+            records.append(DECODER.decode(line))
+    return records
+
+
+class NDJSONSource:
+    """Lazy reader of newline-delimited JSON for JSONAdapter.
+
+    Records are decoded line by line while the source is read. With
+    workers, chunks of lines are decoded on a process pool with at most
+    two chunks per worker in flight, and records keep their order.
+
+    Attributes:
+        source: Path of the file, an open file object or any iterable of
+            str or bytes lines.
+        workers: Decoding processes, 0 to decode in this process.
+        chunk_lines: Lines sent to a worker at once.
+    """
+
+    def __init__(self, source: Union[str, Iterable[Union[str, bytes]]],
+                 workers: int = 0, chunk_lines: int = 1024) -> None:
+        """Initialize an NDJSONSource.
+
+        Args:
+            source: Path of the file, an open file object or an iterable
+                of lines.
+            workers: Decoding processes, 0 to decode in this process.
+            chunk_lines: Lines sent to a worker at once.
+
+        Raises:
+            ValueError: If workers is negative or chunk_lines not positive.
+        """
+        if workers < 0 or chunk_lines < 1:
+            raise ValueError("Invalid NDJSON decoding settings")
+        self.source: Union[str, Iterable[Union[str, bytes]]] = source
+        self.workers: int = workers
+        self.chunk_lines: int = chunk_lines
+
+    def __iter__(self) -> Iterator[Any]:
+        """Read and decode the source record by record.
+
+        Returns:
+            An iterator over the decoded records.
+
+        Raises:
+            ValueError: If the file can't be read or a line is invalid.
+        """
+        if isinstance(self.source, str):
+            try:
+                with open(self.source, "rb") as file:
+                    yield from self.decode(file)
+            except OSError as e:
+                raise ValueError(f"Error reading NDJSON: {e}")
+        else:
+            yield from self.decode(self.source)
+
+    def decode(self, lines: Iterable[Union[str, bytes]]) -> Iterator[Any]:
+        """Decode lines in this process or on the pool.
+
+        Args:
+            lines: The raw lines.
+
+        Returns:
+            An iterator over the decoded records.
+
+        Raises:
+            ValueError: If a line is not valid JSON.
+        """
+        if self.workers == 0:
+            for line in lines:
+                yield from decode_lines([line])
+            return
+        chunks: Iterator[List[Any]] = micro_batches(lines, self.chunk_lines)
+        pending: deque[Future[List[Any]]] = deque()
+        with ProcessPoolExecutor(self.workers) as pool:
+            for chunk in chunks:
+                pending.append(pool.submit(decode_lines, chunk))
+                if len(pending) >= 2 * self.workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+class EndOfStream:
+    """Marker sent through pipelined queues after the last record."""
+
+
+class StageFailure:
+    """Marker carrying an error raised while producing records.
+
+    Attributes:
+        error: The exception raised.
+    """
+
+    def __init__(self, error: BaseException) -> None:
+        """Initialize a StageFailure.
+
+        Args:
+            error: The exception raised.
+        """
+        self.error: BaseException = error
+
+
+def read_queue(inbox: Any, failures: List[StageFailure]) -> Iterator[Any]:
+    """Yield records from a queue until the end marker.
+
+    Args:
+        inbox: The queue to read.
+        failures: Receives the failure marker if one arrives.
+
+    Returns:
+        An iterator over the records.
+    """
+    while True:
+        item: Any = inbox.get()
+        if isinstance(item, EndOfStream):
+            return
+        if isinstance(item, StageFailure):
+            failures.append(item)
+            return
+        yield item
+
+
+def feed_queue(records: Iterable[Any], outbox: Any,
+               stop: threading.Event) -> None:
+    """Put every record in the first queue of a pipelined run.
+
+    Args:
+        records: The records to send.
+        outbox: The queue of the first stage.
+        stop: Set when the run is abandoned, ends the input early.
+    """
+    try:
+        for record in records:
+            if stop.is_set():
+                break
+            outbox.put(record)
+    except Exception as e:
+        outbox.put(StageFailure(e))
+        return
+    outbox.put(EndOfStream())
+
+
+def run_stage(stage: ProcessingStage, inbox: Any, outbox: Any) -> None:
+    """Run one stage of a pipelined run until its input ends.
+
+    After a failure the rest of the input is drained so upstream workers
+    never block on a full queue.
+
+    Args:
+        stage: The stage to run.
+        inbox: The queue of incoming records.
+        outbox: The queue of the next stage.
+    """
+    failures: List[StageFailure] = []
+    records: Iterator[Any] = read_queue(inbox, failures)
+    stream: Optional[Callable[[Iterable[Any]], Iterator[Any]]] = getattr(
+        stage, "stream", None)
+    try:
+        for result in (stream(records) if stream is not None
+                       else map(stage.process, records)):
+            outbox.put(result)
+    except Exception as e:
+        outbox.put(StageFailure(e))
+        for _ in records:
+            pass
+        return
+    outbox.put(failures[0] if failures else EndOfStream())
+
+
+def collect_queue(inbox: Any, workers: List[Any],
+                  stop: threading.Event) -> Iterator[Any]:
+    """Start the workers of a pipelined run and yield its results.
+
+    When the run is abandoned or fails, stop ends the input and the last
+    queue is drained until its end marker, so every worker finishes and
+    is joined. Closing an abandoned run waits for the record the feeder
+    is reading.
+
+    Args:
+        inbox: The queue of the last stage.
+        workers: The stage workers then the feeder, started in order.
+        stop: The stop event of the feeder.
+
+    Returns:
+        An iterator over the processed records.
+    """
+    for worker in workers:
+        worker.start()
+    ended: bool = False
+    try:
+        while True:
+            item: Any = inbox.get()
+            if isinstance(item, EndOfStream):
+                ended = True
+                break
+            if isinstance(item, StageFailure):
+                ended = True
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        while not ended:
+            ended = isinstance(inbox.get(), (EndOfStream, StageFailure))
+        for worker in workers:
+            worker.join()
+
+
+def identity(data: Any) -> Any:
+    """Return data unchanged, dropped from fused plans.
+
+    Args:
+        data: Any data.
+
+    Returns:
+        The same data.
+    """
+    return data
+
+
+def dispatch_by_type(specialize: Callable[[type], Any]
+                     ) -> Callable[[Any], Any]:
+    """Wrap a stage so its branch is resolved once per record type.
+
+    Args:
+        specialize: The specialize method of the stage.
+
+    Returns:
+        A callable running the branch cached for the type of its input.
+    """
+    branches: Dict[type, Callable[[Any], Any]] = {}
+
+    def dispatch(data: Any) -> Any:
+        branch: Optional[Callable[[Any], Any]] = branches.get(type(data))
+        if branch is None:
+            branch = branches[type(data)] = specialize(type(data))[0]
+        return branch(data)
+    return dispatch
+
+
+def fuse_steps(steps: List[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Compose steps into a single callable.
+
+    Args:
+        steps: The callables to run, in order.
+
+    Returns:
+        The callable running every step, identity if there is none.
+    """
+    if not steps:
+        return identity
+    fused: Callable[[Any], Any] = steps[0]
+    for step in steps[1:]:
+        fused = chain_steps(fused, step)
+    return fused
+
+
+def chain_steps(first: Callable[[Any], Any],
+                second: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Compose two steps.
+
+    Args:
+        first: The step run first.
+        second: The step run on the result of first.
+
+    Returns:
+        The composed callable.
+    """
+    return lambda data: second(first(data))
+
+
 class InputStage:
     """Processing stage for input validation and parsing.
 
@@ -94,18 +778,83 @@ class InputStage:
             TypeError: If the input data type is not supported.
         """
         print(f"Input: {data}")
+        return self.parse(data)
+
+    def parse(self, data: Any) -> Any:
+        """Parse input data without logging it.
+
+        Args:
+            data: The input data to validate and parse.
+
+        Returns:
+            The parsed data in the appropriate format.
+
+        Raises:
+            TypeError: If the input data type is not supported.
+        """
         if isinstance(data, str):
-            if "," in data:
-                result: deque[str] = deque(data.split(","))
-                return result
-            return data
+            return self.parse_text(data)
         if isinstance(data, list):
-            result_list: deque[Any] = deque(data)
-            return result_list
+            return deque(data)
         if isinstance(data, dict):
             return data
+        return self.reject(data)
+
+    def specialize(self, data_type: type
+                   ) -> Tuple[Callable[[Any], Any], Optional[type]]:
+        """Resolve the parsing branch for one input type.
+
+        Args:
+            data_type: The type of the input data.
+
+        Returns:
+            The branch function and the type it returns, None when it
+            depends on the data.
+        """
+        if issubclass(data_type, str):
+            return self.parse_text, None
+        if issubclass(data_type, list):
+            return deque, deque
+        if issubclass(data_type, dict):
+            return identity, data_type
+        return self.reject, None
+
+    def parse_text(self, data: str) -> Any:
+        """Split CSV text into a deque, other text is kept as is.
+
+        Args:
+            data: The text to parse.
+
+        Returns:
+            A deque of fields or the original text.
+        """
+        if "," in data:
+            result: deque[str] = deque(data.split(","))
+            return result
+        return data
+
+    def reject(self, data: Any) -> Any:
+        """Reject unsupported input data.
+
+        Args:
+            data: The unsupported data.
+
+        Raises:
+            TypeError: Always.
+        """
         raise TypeError("Invalid input data")
 
+    def stream(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Parse records one at a time without logging them.
+
+        Args:
+            records: The input records.
+
+        Returns:
+            An iterator over the parsed records.
+        """
+        return map(self.parse, records)
+
 
 class TransformStage:
     """Processing stage for data transformation and enrichment.
@@ -126,24 +875,91 @@ class TransformStage:
         Returns:
             The transformed data.
         """
-        if isinstance(data, dict) and "value" in data:
+        if isinstance(data, dict) and "value" in data \
+                and not isinstance(data, ColumnBatch):
+            print("Transform: Enriched with metadata and validation")
+        elif isinstance(data, deque):
+            print("Transform: Aggregated and filtered")
+        else:
+            print("Transform: Parsed and structured data")
+        return self.transform(data)
+
+    def transform(self, data: Any) -> Any:
+        """Transform and enrich data without logging it.
+
+        Args:
+            data: The data to transform.
+
+        Returns:
+            The transformed data.
+        """
+        if isinstance(data, ColumnBatch):
+            return data
+        if isinstance(data, dict):
+            return self.enrich(data)
+        if isinstance(data, deque):
+            return self.drop_errors(data)
+        return data
+
+    def specialize(self, data_type: type
+                   ) -> Tuple[Callable[[Any], Any], Optional[type]]:
+        """Resolve the transformation branch for one input type.
+
+        Args:
+            data_type: The type of the data to transform.
+
+        Returns:
+            The branch function and the type it returns.
+        """
+        if issubclass(data_type, ColumnBatch):
+            return identity, data_type
+        if issubclass(data_type, dict):
+            return self.enrich, data_type
+        if issubclass(data_type, deque):
+            return self.drop_errors, list
+        return identity, data_type
+
+    def enrich(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the range of a reading when it has a value.
+
+        Args:
+            data: The reading.
+
+        Returns:
+            The same reading.
+        """
+        if "value" in data:
             value: float = data["value"]
             range_str: str = (
                 "(Normal range)" if 20 <= value <= 30 else "(Suspicious range)"
             )
             data["range"] = range_str
-            print("Transform: Enriched with metadata and validation")
-            return data
+        return data
 
-        if isinstance(data, deque):
-            print("Transform: Aggregated and filtered")
-            filtered: List[Any] = [
-                d for d in data if not isinstance(d, str) or d != "error"
-            ]
-            return filtered
+    def drop_errors(self, data: deque) -> List[Any]:
+        """Filter out error entries.
 
-        print("Transform: Parsed and structured data")
-        return data
+        Args:
+            data: The entries.
+
+        Returns:
+            The entries that are not "error".
+        """
+        filtered: List[Any] = [
+            d for d in data if not isinstance(d, str) or d != "error"
+        ]
+        return filtered
+
+    def stream(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Transform records one at a time without logging them.
+
+        Args:
+            records: The records to transform.
+
+        Returns:
+            An iterator over the transformed records.
+        """
+        return map(self.transform, records)
 
 
 class OutputStage:
@@ -156,6 +972,7 @@ class OutputStage:
         """Format and prepare output data.
 
         Generates formatted output strings based on the data type:
+        - ColumnBatch: CSV batch summary
         - Dictionary: Temperature reading with range info
         - List: Stream summary with statistics
         - Deque: User activity log summary
@@ -166,30 +983,97 @@ class OutputStage:
         Returns:
             A formatted output string or the original data.
         """
+        if isinstance(data, ColumnBatch):
+            return self.format_batch(data)
         if isinstance(data, dict):
-            output: str = (
-                f"Output: Processed temperature reading: "
-                f"{data.get('value')}°{data.get('unit')} {data.get('range')}"
-            )
-            return output
-
+            return self.format_reading(data)
         if isinstance(data, list):
-            avg: float = sum(data) / len(data) if data else 0
-            output_list: str = (
-                f"Output: Stream summary: {len(data)} readings, "
-                f"avg: {avg:.1f}°C"
-            )
-            return output_list
-
+            return self.format_summary(data)
         if isinstance(data, deque):
-            output_deque: str = (
-                f"Output: User activity logged: {len(data)} "
-                "actions processed"
-            )
-            return output_deque
-
+            return self.format_activity(data)
         return data
 
+    def specialize(self, data_type: type
+                   ) -> Tuple[Callable[[Any], Any], Optional[type]]:
+        """Resolve the formatting branch for one input type.
+
+        Args:
+            data_type: The type of the data to format.
+
+        Returns:
+            The branch function and the type it returns.
+        """
+        if issubclass(data_type, ColumnBatch):
+            return self.format_batch, str
+        if issubclass(data_type, dict):
+            return self.format_reading, str
+        if issubclass(data_type, list):
+            return self.format_summary, str
+        if issubclass(data_type, deque):
+            return self.format_activity, str
+        return identity, data_type
+
+    def format_batch(self, data: ColumnBatch) -> str:
+        """Format a CSV column batch.
+
+        Args:
+            data: The batch.
+
+        Returns:
+            The batch summary.
+        """
+        output_batch: str = (
+            f"Output: CSV batch: {data.rows} rows, "
+            f"columns: {', '.join(data)}"
+        )
+        return output_batch
+
+    def format_reading(self, data: Dict[str, Any]) -> str:
+        """Format a temperature reading.
+
+        Args:
+            data: The reading.
+
+        Returns:
+            The reading with its range.
+        """
+        output: str = (
+            f"Output: Processed temperature reading: "
+            f"{data.get('value')}°{data.get('unit')} {data.get('range')}"
+        )
+        return output
+
+    def format_summary(self, data: List[Any]) -> str:
+        """Format a stream of readings.
+
+        Args:
+            data: The readings.
+
+        Returns:
+            The stream summary with its average.
+        """
+        avg: float = sum(data) / len(data) if data else 0
+        output_list: str = (
+            f"Output: Stream summary: {len(data)} readings, "
+            f"avg: {avg:.1f}°C"
+        )
+        return output_list
+
+    def format_activity(self, data: deque) -> str:
+        """Format a user activity log.
+
+        Args:
+            data: The logged actions.
+
+        Returns:
+            The activity summary.
+        """
+        output_deque: str = (
+            f"Output: User activity logged: {len(data)} "
+            "actions processed"
+        )
+        return output_deque
+
 
 class JSONAdapter(ProcessingPipeline):
     """Pipeline adapter for processing JSON-formatted data.
@@ -213,6 +1097,22 @@ class JSONAdapter(ProcessingPipeline):
         self.add_stage(TransformStage())
         self.add_stage(OutputStage())
 
+    def process_ndjson(self, source: Union[str, Iterable[Union[str, bytes]]],
+                       workers: int = 0,
+                       chunk_lines: int = 1024) -> Iterator[Any]:
+        """Stream newline-delimited JSON through the pipeline per record.
+
+        Args:
+            source: Path of the file, an open file object or an iterable
+                of lines.
+            workers: Decoding processes, 0 to decode in this process.
+            chunk_lines: Lines sent to a worker at once.
+
+        Returns:
+            An iterator over the output of each record.
+        """
+        return self.stream(NDJSONSource(source, workers, chunk_lines))
+
     def process(self, data: Any) -> Any:
         """Process JSON data through all pipeline stages.
 
@@ -226,9 +1126,7 @@ class JSONAdapter(ProcessingPipeline):
             Exception: If any stage fails during processing.
         """
         try:
-            for stage in self.stages:
-                data = stage.process(data)
-            return data
+            return self.run_stages(data)
         except Exception:
             raise
 
@@ -254,6 +1152,20 @@ class CSVAdapter(ProcessingPipeline):
         self.add_stage(InputStage())
         self.add_stage(OutputStage())
 
+    def process_csv(self, source: Union[str, IO[str]],
+                    batch_size: int = 1024, **options: Any) -> Iterator[Any]:
+        """Stream a CSV file through the pipeline in column batches.
+
+        Args:
+            source: Path of the file or an open text file object.
+            batch_size: Maximum number of rows per batch.
+            options: Other CSVSource options (header, types, dialect).
+
+        Returns:
+            An iterator over the output of each batch.
+        """
+        return self.stream(CSVSource(source, batch_size, **options))
+
     def process(self, data: Any) -> Any:
         """Process CSV data through the pipeline stages.
 
@@ -267,9 +1179,7 @@ class CSVAdapter(ProcessingPipeline):
             Exception: If any stage fails during processing.
         """
         try:
-            for stage in self.stages:
-                data = stage.process(data)
-            return data
+            return self.run_stages(data)
         except Exception:
             raise
 
@@ -309,9 +1219,7 @@ class StreamAdapter(ProcessingPipeline):
             Exception: If any stage fails during processing.
         """
         try:
-            for stage in self.stages:
-                data = stage.process(data)
-            return data
+            return self.run_stages(data)
         except Exception:
             raise
 
@@ -341,6 +1249,25 @@ class NexusManager:
         """
         self.pipelines[pipeline.get_id()] = pipeline
 
+    def stream(self, pipeline_id: str, records: Iterable[Any],
+               batch_size: Optional[int] = None) -> Iterator[Any]:
+        """Stream records through the specified pipeline.
+
+        Args:
+            pipeline_id: The ID of the pipeline to use.
+            records: The records to process, consumed lazily.
+            batch_size: Optional micro-batch size.
+
+        Returns:
+            An iterator over the processed records.
+
+        Raises:
+            ValueError: If the pipeline ID is not found in the registry.
+        """
+        if pipeline_id not in self.pipelines:
+            raise ValueError("Pipeline not found")
+        return self.pipelines[pipeline_id].stream(records, batch_size)
+
     def process(self, pipeline_id: str, data: Any) -> Any:
         """Process data using the specified pipeline.
 